@@ -0,0 +1,21 @@
+import inspect
+import unittest
+import importlib.util
+
+
+@unittest.skipUnless(importlib.util.find_spec("selenium"), "selenium is not installed")
+class TestFibonacciExecutorImport(unittest.TestCase):
+    def test_import(self):
+        from utils.executor_fibonacci import FibonacciExecutor
+        from utils.executor_stealth_fixed import StealthExecutor
+        
+        # The pooled driver API used by the Fibonacci strategy lives on the stealth parent
+        self.assertTrue(issubclass(FibonacciExecutor, StealthExecutor))
+        self.assertTrue(callable(getattr(FibonacciExecutor, "acquire_driver", None)))
+        self.assertTrue(callable(getattr(FibonacciExecutor, "release_driver", None)))
+        
+        # Error handlers force failure screenshots even without DEBUG_SCREENSHOTS
+        self.assertIn("force", inspect.signature(FibonacciExecutor._save_screenshot).parameters)
+
+if __name__ == '__main__':
+    unittest.main()
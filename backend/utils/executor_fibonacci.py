@@ -1,8 +1,8 @@
 import os
 import json
+import asyncio
 import time
 import random
-import datetime
 import math
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -11,7 +11,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from utils.executor_stealth import StealthExecutor
+from utils.executor_stealth_fixed import StealthExecutor
 from dotenv import load_dotenv
 
 class FibonacciExecutor(StealthExecutor):
@@ -41,6 +41,10 @@ class FibonacciExecutor(StealthExecutor):
         # Calculate Fibonacci targets
         self.fib_targets = self._calculate_fib_targets()
         
+        # Retest window is 0.1% of each target, computed once per target set
+        self._retest_threshold_ratio = 0.001
+        self.retest_thresholds = [t * self._retest_threshold_ratio for t in self.fib_targets]
+        
         # Initialize tracking variables
         self.executed_levels = [False] * len(self.fib_levels)
         self.current_position_size = float(self.signal["quantity"])
@@ -88,7 +92,7 @@ class FibonacciExecutor(StealthExecutor):
         try:
             # Wait for price element to be present
             price_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'current-price')]")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='current-price']")),
                 message="Current price element not found"
             )
             
@@ -102,6 +106,25 @@ class FibonacciExecutor(StealthExecutor):
             # Fallback to entry price if can't get current price
             return self.entry_price
     
+    def _batch_humanlike_typing(self, driver, element, text):
+        """
+        Type text like a human, queuing keystrokes and pauses in one ActionChains
+        so the whole sequence is dispatched to the driver in a single command
+        """
+        actions = ActionChains(driver).click(element)
+        for char in text:
+            actions.send_keys(char).pause(random.uniform(0.05, 0.15))
+        actions.perform()
+    
+    def _type_text(self, driver, element, text):
+        """
+        Type into an element, batching keystrokes into one driver command at higher stealth levels
+        """
+        if self.stealth_level >= 2:
+            self._batch_humanlike_typing(driver, element, text)
+        else:
+            element.send_keys(text)
+    
     def _close_partial_position(self, driver, percent):
         """
         Close a partial position at a Fibonacci target level
@@ -110,13 +133,13 @@ class FibonacciExecutor(StealthExecutor):
             # Calculate quantity to close
             close_quantity = round(self.current_position_size * percent, 2)
             
-            # Navigate to positions page
-            driver.get(f"{self.broker_url}/positions")
-            time.sleep(random.uniform(1.0, 2.0))
+            # Navigate to positions page unless a previous close already left us there
+            if '/positions' not in driver.current_url:
+                driver.get(f"{self.broker_url}/positions")
             
             # Wait for positions table to load
             WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'positions-table')]")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='positions-table']")),
                 message="Positions table did not load in time"
             )
             
@@ -133,17 +156,17 @@ class FibonacciExecutor(StealthExecutor):
             
             # Wait for position details panel
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'position-details')]")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='position-details']")),
                 message="Position details panel did not appear"
             )
             
             # Find partial close input
-            quantity_input = driver.find_element(By.XPATH, "//input[@placeholder='Quantity']")
+            quantity_input = driver.find_element(By.CSS_SELECTOR, "input[placeholder='Quantity']")
             
             if self.stealth_level >= 2:
                 self._humanlike_movement(driver, quantity_input)
                 quantity_input.clear()
-                self._humanlike_typing(quantity_input, str(close_quantity))
+                self._batch_humanlike_typing(driver, quantity_input, str(close_quantity))
             else:
                 quantity_input.clear()
                 quantity_input.send_keys(str(close_quantity))
@@ -157,7 +180,7 @@ class FibonacciExecutor(StealthExecutor):
             
             # Wait for confirmation dialog
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'confirmation-dialog')]")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='confirmation-dialog']")),
                 message="Confirmation dialog did not appear"
             )
             
@@ -172,34 +195,16 @@ class FibonacciExecutor(StealthExecutor):
             self.current_position_size -= close_quantity
             
             # Take screenshot for record
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            driver.save_screenshot(f"{self.screenshot_dir}/fibonacci_partial_close_{timestamp}.png")
+            self._save_screenshot(driver, "fibonacci_partial_close", force=True)
             
             print(f"🔒 Closed {percent * 100:.0f}% of position ({close_quantity} units)")
             return True
         except Exception as e:
             print(f"Error closing partial position: {e}")
             # Take screenshot of the error state
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            driver.save_screenshot(f"{self.screenshot_dir}/fibonacci_close_error_{timestamp}.png")
+            self._save_screenshot(driver, "fibonacci_close_error", force=True)
             return False
     
-    def _price_rejects_and_retests(self, current_price, target_level):
-        """
-        Determine if price has rejected from and is now retesting a Fibonacci level
-        """
-        # This is a simplified implementation
-        # In a real system, you would analyze price action more thoroughly
-        is_long = self.signal["side"].lower() == "buy"
-        
-        # For longs, price should have gone above target and then pulled back to it
-        # For shorts, price should have gone below target and then pulled back to it
-        price_diff = abs(current_price - target_level)
-        price_threshold = target_level * 0.001  # 0.1% threshold
-        
-        # If price is within threshold of the target level, consider it a retest
-        return price_diff < price_threshold
-    
     def _regenerate_signal_from_current(self, driver, last_tp_level):
         """
         Generate a new signal for reentry after a pullback
@@ -235,28 +240,31 @@ class FibonacciExecutor(StealthExecutor):
         
         return new_signal
     
-    def _monitor_and_execute_fibonacci_strategy(self, driver):
+    async def _monitor_async(self, driver):
         """
-        Monitor price and execute the Fibonacci strategy
+        Monitor price and execute the Fibonacci strategy as a coroutine
+        
+        Blocking Selenium calls run in worker threads and the waits between
+        price checks are awaited, so one event loop can supervise many monitors
         """
         try:
             # Navigate to trading page
-            driver.get(f"{self.broker_url}/trading")
-            time.sleep(random.uniform(2.0, 4.0))
+            await asyncio.to_thread(driver.get, f"{self.broker_url}/trading")
             
             # Wait for trading interface to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'trading-interface')]")),
-                message="Trading interface did not load in time"
+            await asyncio.to_thread(
+                WebDriverWait(driver, 15).until,
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='trading-interface']")),
+                "Trading interface did not load in time"
             )
             
             # Initial trade placement
-            success = self._place_trade(driver)
+            success = await asyncio.to_thread(self._place_trade, driver)
             if not success:
                 return False
             
             # Log initial trade
-            self._log_trade(success)
+            await asyncio.to_thread(self._log_trade, success)
             
             # Print Fibonacci targets
             is_long = self.signal["side"].lower() == "buy"
@@ -270,7 +278,7 @@ class FibonacciExecutor(StealthExecutor):
             
             while time.time() - start_time < monitoring_duration:
                 # Get current price
-                current_price = self._get_current_price(driver)
+                current_price = await asyncio.to_thread(self._get_current_price, driver)
                 print(f"🔍 Price Check: {current_price}")
                 
                 # Check each Fibonacci target
@@ -281,7 +289,7 @@ class FibonacciExecutor(StealthExecutor):
                     # Check if price has reached target
                     if (is_long and current_price >= target) or (not is_long and current_price <= target):
                         # Close partial position at this target
-                        close_success = self._close_partial_position(driver, self.tp_percentages[i])
+                        close_success = await asyncio.to_thread(self._close_partial_position, driver, self.tp_percentages[i])
                         if close_success:
                             self.executed_levels[i] = True
                 
@@ -291,30 +299,30 @@ class FibonacciExecutor(StealthExecutor):
                     last_tp_index = max(i for i, hit in enumerate(self.executed_levels) if hit)
                     last_tp_level = self.fib_targets[last_tp_index]
                     
-                    # Check if price is retesting this level
-                    if self._price_rejects_and_retests(current_price, last_tp_level):
+                    # Check if price is retesting this level (within 0.1% of it)
+                    if abs(current_price - last_tp_level) < self.retest_thresholds[last_tp_index]:
                         # Generate new signal for reentry
-                        new_signal = self._regenerate_signal_from_current(driver, last_tp_level)
+                        new_signal = await asyncio.to_thread(self._regenerate_signal_from_current, driver, last_tp_level)
                         
                         # Update current signal and recalculate targets
                         self.signal = new_signal
                         self.fib_targets = self._calculate_fib_targets()
+                        self.retest_thresholds = [t * self._retest_threshold_ratio for t in self.fib_targets]
                         self.executed_levels = [False] * len(self.fib_levels)
                         
                         # Execute new trade
-                        success = self._place_trade(driver)
+                        success = await asyncio.to_thread(self._place_trade, driver)
                         if success:
-                            self._log_trade(success)
+                            await asyncio.to_thread(self._log_trade, success)
                 
                 # Wait before next check
-                time.sleep(check_interval)
+                await asyncio.sleep(check_interval)
             
             return True
         except Exception as e:
             print(f"Error in Fibonacci strategy execution: {e}")
             # Take screenshot of the error state
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            driver.save_screenshot(f"{self.screenshot_dir}/fibonacci_strategy_error_{timestamp}.png")
+            await asyncio.to_thread(self._save_screenshot, driver, "fibonacci_strategy_error", True)
             return False
     
     def execute_trade(self):
@@ -325,8 +333,8 @@ class FibonacciExecutor(StealthExecutor):
         success = False
         
         try:
-            # Initialize driver with stealth features
-            driver = self._init_driver()
+            # Lease a warm driver with stealth features from the pool
+            driver = self.acquire_driver()
             
             # Random delay before starting
             time.sleep(random.uniform(1.0, 3.0))
@@ -343,16 +351,16 @@ class FibonacciExecutor(StealthExecutor):
             
             # Wait for trading interface to load
             WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'trading-interface') or contains(@id, 'trade')]") ),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='trading-interface'], div[id*='trade']") ),
                 message="Trading interface did not load in time"
             )
             
             # Input symbol
             symbol_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@name='symbol' or contains(@placeholder, 'Symbol')]") )
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='symbol'], input[placeholder*='Symbol']") )
             )
             symbol_input.clear()
-            symbol_input.send_keys(self.signal.get('symbol'))
+            self._type_text(driver, symbol_input, self.signal.get('symbol'))
             time.sleep(random.uniform(0.5, 1.0))
             
             # Select buy or sell
@@ -368,33 +376,33 @@ class FibonacciExecutor(StealthExecutor):
             time.sleep(random.uniform(0.5, 1.0))
             
             # Input quantity
-            quantity_input = driver.find_element(By.XPATH, "//input[@name='quantity' or contains(@placeholder, 'Quantity')]" )
+            quantity_input = driver.find_element(By.CSS_SELECTOR, "input[name='quantity'], input[placeholder*='Quantity']" )
             quantity_input.clear()
-            quantity_input.send_keys(str(self.signal.get('quantity')))
+            self._type_text(driver, quantity_input, str(self.signal.get('quantity')))
             time.sleep(random.uniform(0.5, 1.0))
             
             # Input entry price if applicable
             entry_price = self.signal.get('entry')
             if entry_price:
-                entry_input = driver.find_element(By.XPATH, "//input[@name='entry' or contains(@placeholder, 'Entry')]" )
+                entry_input = driver.find_element(By.CSS_SELECTOR, "input[name='entry'], input[placeholder*='Entry']" )
                 entry_input.clear()
-                entry_input.send_keys(str(entry_price))
+                self._type_text(driver, entry_input, str(entry_price))
                 time.sleep(random.uniform(0.5, 1.0))
             
             # Input stop loss if set
             stop_loss = self.stopLoss
             if stop_loss:
-                stop_loss_input = driver.find_element(By.XPATH, "//input[@name='stopLoss' or contains(@placeholder, 'Stop Loss')]" )
+                stop_loss_input = driver.find_element(By.CSS_SELECTOR, "input[name='stopLoss'], input[placeholder*='Stop Loss']" )
                 stop_loss_input.clear()
-                stop_loss_input.send_keys(str(stop_loss))
+                self._type_text(driver, stop_loss_input, str(stop_loss))
                 time.sleep(random.uniform(0.5, 1.0))
             
             # Input take profit if set
             take_profit = self.takeProfit
             if take_profit:
-                take_profit_input = driver.find_element(By.XPATH, "//input[@name='takeProfit' or contains(@placeholder, 'Take Profit')]" )
+                take_profit_input = driver.find_element(By.CSS_SELECTOR, "input[name='takeProfit'], input[placeholder*='Take Profit']" )
                 take_profit_input.clear()
-                take_profit_input.send_keys(str(take_profit))
+                self._type_text(driver, take_profit_input, str(take_profit))
                 time.sleep(random.uniform(0.5, 1.0))
             
             # Place the trade
@@ -415,10 +423,48 @@ class FibonacciExecutor(StealthExecutor):
             
             # Take screenshot on failure
             if driver:
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_path = f"logs/fibonacci_trade_failure_{timestamp}.png"
-                driver.save_screenshot(screenshot_path)
+                self._save_screenshot(driver, "fibonacci_trade_failure", force=True)
+        finally:
+            if driver:
+                self.release_driver(driver)
+        return success
+    
+    async def execute_trade_async(self):
+        """
+        Run the full Fibonacci strategy (login, entry, partial exits and
+        re-entries) without tying up a thread while waiting between price checks
+        """
+        driver = None
+        try:
+            driver = await asyncio.to_thread(self.acquire_driver)
+            
+            # Random delay before starting
+            await asyncio.sleep(random.uniform(1.0, 3.0))
+            
+            if not await asyncio.to_thread(self._login, driver):
+                raise Exception("Failed to login to broker")
+            
+            # Random delay between login and trade
+            await asyncio.sleep(random.uniform(2.0, 5.0))
+            
+            return await self._monitor_async(driver)
+        except Exception as e:
+            print(f"Fibonacci strategy execution failed: {e}")
+            await asyncio.to_thread(self._log_trade, False)
+            return False
         finally:
             if driver:
-                driver.quit()
-        return success
\ No newline at end of file
+                await asyncio.to_thread(self.release_driver, driver)
+
+
+async def run_fibonacci_executors(executors):
+    """
+    Supervise several Fibonacci strategies concurrently on one event loop
+    
+    Args:
+        executors: Iterable of FibonacciExecutor instances
+    
+    Returns:
+        List of per-executor success flags, in input order
+    """
+    return await asyncio.gather(*[e.execute_trade_async() for e in executors])
@@ -1,24 +1,666 @@
 import os
+import re
 import time
 import random
 import json
+import base64
 import datetime
-from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import atexit
+import queue
+import threading
+import contextlib
+import functools
+import logging
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from .base_executor import BaseExecutor
 
+logger = logging.getLogger(__name__)
+
+# Selenium is imported on first use (see _lazy_selenium) so that importing this
+# module stays cheap for processes that never drive a browser
+webdriver = Options = Service = By = WebDriverWait = EC = ActionChains = Keys = None
+TimeoutException = NoSuchElementException = None
+_selenium_loaded = False
+
+
+def _lazy_selenium():
+    """
+    Import the Selenium names this module uses, once per process
+    """
+    global _selenium_loaded, webdriver, Options, Service, By, WebDriverWait, EC, ActionChains, Keys
+    global TimeoutException, NoSuchElementException
+    if _selenium_loaded:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.common.keys import Keys
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    _selenium_loaded = True
+
+
+@dataclass(frozen=True)
+class _BrokerCfg:
+    username: str
+    password: str
+    url: str
+    profile_path: str
+    profile_name: str
+    proxy: str
+    chromedriver_path: str
+
+
+@functools.lru_cache(maxsize=1)
+def _broker_cfg():
+    """
+    Read broker credentials and browser settings from the environment, once per process
+    
+    Returns:
+        _BrokerCfg shared by every StealthExecutor
+    """
+    _load_env()
+    url = os.getenv('BROKER_URL')
+    if url is None:
+        url = "https://bulenox.com/login"
+    cfg = _BrokerCfg(
+        username=os.getenv('BROKER_USERNAME'),
+        password=os.getenv('BROKER_PASSWORD'),
+        url=url,
+        profile_path=os.getenv('BULENOX_PROFILE_PATH'),
+        profile_name=os.getenv('BULENOX_PROFILE_NAME'),
+        proxy=os.getenv('PROXY_SERVER'),
+        chromedriver_path=os.getenv('CHROMEDRIVER_PATH')
+    )
+    if os.getenv("VERBOSE"):
+        print(f"Broker URL: {cfg.url}")
+        print(f"Using Chrome profile: {cfg.profile_path}/{cfg.profile_name}")
+    return cfg
+
+
+# Resource URL patterns blocked in pooled drivers below stealth level 3
+_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.woff*", "*.mp4",
+    "*google-analytics*", "*doubleclick*", "*facebook.net*", "*hotjar*"
+)
+
+_SCREENSHOT_DIR = os.path.join(os.getcwd(), "logs/screenshots")
+_LOG_FILE = "logs/stealth_trades.jsonl"
+_LOG_FLUSH_INTERVAL = 5.0
+_log_handles = {}
+_log_lock = threading.Lock()
+_log_last_flush = 0.0
+
+
+def _append_trade_log(record, path=_LOG_FILE):
+    """
+    Append one trade record to a trade log
+    
+    NDJSON logs (*.jsonl) are written through one buffered handle per path, opened
+    on first use and kept for the life of the process. Their buffers are flushed at
+    most every _LOG_FLUSH_INTERVAL seconds and at exit. Any other path holds a JSON
+    list, as its readers expect, and is rewritten with the record appended.
+    
+    Args:
+        record: Trade record dictionary
+        path: Trade log path (defaults to the stealth trade log)
+    """
+    global _log_last_flush
+    with _log_lock:
+        if not path.endswith(".jsonl"):
+            _append_json_list(path, record)
+            return
+        fh = _log_handles.get(path)
+        if fh is None:
+            _ensure_dirs()
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            fh = _log_handles[path] = open(path, "a", buffering=65536)
+            if len(_log_handles) == 1:
+                atexit.register(_flush_trade_log)
+        fh.write(json.dumps(record, separators=(',', ':')) + "\n")
+        now = time.monotonic()
+        if now - _log_last_flush >= _LOG_FLUSH_INTERVAL:
+            for handle in _log_handles.values():
+                handle.flush()
+            _log_last_flush = now
+
+
+def _append_json_list(path, record):
+    """
+    Append a record to the JSON list stored at path, replacing the file atomically
+    """
+    try:
+        with open(path, "r") as f:
+            trades = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        trades = []
+    trades.append(record)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(trades, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _flush_trade_log():
+    """
+    Flush the trade log buffers to disk
+    """
+    with _log_lock:
+        for handle in _log_handles.values():
+            handle.flush()
+
+
+_SELECTOR_CACHE_FILE = "logs/broker_selectors.json"
+_selector_cache = None
+_selector_lock = threading.Lock()
+
+
+def _cached_login_selectors(broker_url):
+    """
+    Login selectors that worked last time for a broker URL
+    
+    Args:
+        broker_url: Broker login URL the selectors were recorded for
+    
+    Returns:
+        Dictionary of username/password/button CSS selectors, empty if unknown
+    """
+    global _selector_cache
+    with _selector_lock:
+        if _selector_cache is None:
+            try:
+                with open(_SELECTOR_CACHE_FILE, "r") as f:
+                    _selector_cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                _selector_cache = {}
+        return dict(_selector_cache.get(broker_url, {}))
+
+
+def _store_login_selectors(broker_url, selectors):
+    """
+    Record the login selectors that worked for a broker URL
+    
+    Args:
+        broker_url: Broker login URL
+        selectors: Dictionary of username/password/button CSS selectors
+    """
+    _cached_login_selectors(broker_url)
+    with _selector_lock:
+        if _selector_cache.get(broker_url) == selectors:
+            return
+        _selector_cache[broker_url] = selectors
+        try:
+            _ensure_dirs()
+            with open(_SELECTOR_CACHE_FILE, "w") as f:
+                json.dump(_selector_cache, f, indent=2)
+        except OSError as e:
+            print(f"Error saving login selectors: {e}")
+
+
+def load_trades(path=_LOG_FILE):
+    """
+    Stream trade records from the NDJSON trade log
+    
+    Args:
+        path: Trade log path (defaults to the stealth trade log)
+    
+    Yields:
+        One trade record dictionary per logged trade
+    """
+    _flush_trade_log()
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Skip a partially written last line
+                    continue
+    except FileNotFoundError:
+        return
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_dirs():
+    """
+    Create the screenshot and log directories, once per process
+    """
+    os.makedirs(_SCREENSHOT_DIR, exist_ok=True)
+    os.makedirs(os.path.dirname(_LOG_FILE), exist_ok=True)
+    print(f"Using screenshot directory: {_SCREENSHOT_DIR}")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env():
+    """
+    Load .env into the process environment, once per process
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+class _DriverPool:
+    """
+    Pool of warm Chrome sessions shared by executors with the same browser
+    configuration, so each trade leases a running browser instead of paying
+    Chrome start-up and profile load again
+    """
+    
+    def __init__(self, maxsize=2, profile_wait=120.0):
+        self.maxsize = maxsize
+        self.profile_wait = profile_wait
+        self._idle = {}
+        self._leased = {}
+        self._profile_slots = {}
+        self._auth_times = {}
+        self._lock = threading.Lock()
+    
+    def _queue_for(self, key):
+        with self._lock:
+            if key not in self._idle:
+                # Chrome locks a user-data-dir, so a profile can back one session only
+                size = 1 if key[0] else self.maxsize
+                self._idle[key] = queue.Queue(maxsize=size)
+            return self._idle[key]
+    
+    def _slot_for(self, key):
+        with self._lock:
+            return self._profile_slots.setdefault(key, threading.BoundedSemaphore(1))
+    
+    def acquire(self, key, factory):
+        """
+        Lease an idle driver for this configuration, creating one if none is free
+        
+        A profile-backed configuration has a single driver; while it is leased,
+        other callers wait up to profile_wait seconds for it rather than starting
+        a second Chrome on the locked profile directory.
+        """
+        slot = self._slot_for(key) if key[0] else None
+        if slot is not None and not slot.acquire(timeout=self.profile_wait):
+            raise RuntimeError(f"Chrome profile still in use after {self.profile_wait:.0f}s: {key[1]}/{key[2]}")
+        try:
+            try:
+                driver = self._queue_for(key).get_nowait()
+            except queue.Empty:
+                driver = factory()
+        except Exception:
+            if slot is not None:
+                slot.release()
+            raise
+        with self._lock:
+            self._leased[driver] = key
+        return driver
+    
+    def authenticated_at(self, driver):
+        """
+        time.monotonic() of the driver's last broker login, or None if it has none
+        """
+        with self._lock:
+            return self._auth_times.get(driver)
+    
+    def mark_authenticated(self, driver):
+        """
+        Record that the driver has just logged in to the broker
+        """
+        with self._lock:
+            self._auth_times[driver] = time.monotonic()
+    
+    def release(self, key, driver, clear_cookies=True):
+        """
+        Reset a leased driver and return it to the pool; broken drivers are quit
+        """
+        with self._lock:
+            leased = self._leased.pop(driver, None) is not None
+            if clear_cookies:
+                # Clearing cookies logs the browser out
+                self._auth_times.pop(driver, None)
+        try:
+            if clear_cookies:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._queue_for(key).put_nowait(driver)
+        except Exception:
+            with self._lock:
+                self._auth_times.pop(driver, None)
+            self._quit(driver)
+        finally:
+            if leased:
+                self._free_slot(key)
+    
+    def discard(self, driver):
+        """
+        Quit a leased driver instead of returning it to the pool
+        """
+        with self._lock:
+            key = self._leased.pop(driver, None)
+            self._auth_times.pop(driver, None)
+        self._quit(driver)
+        if key is not None:
+            self._free_slot(key)
+    
+    def _free_slot(self, key):
+        if key[0]:
+            self._slot_for(key).release()
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close_all(self):
+        """
+        Quit every pooled and leased driver
+        """
+        with self._lock:
+            drivers = list(self._leased)
+            self._leased.clear()
+            self._auth_times.clear()
+            for idle in self._idle.values():
+                while True:
+                    try:
+                        drivers.append(idle.get_nowait())
+                    except queue.Empty:
+                        break
+        for driver in drivers:
+            self._quit(driver)
+
+
+_DRIVER_POOL = _DriverPool(maxsize=int(os.getenv('STEALTH_DRIVER_POOL_SIZE', '2')),
+                           profile_wait=float(os.getenv('STEALTH_PROFILE_WAIT', '120')))
+atexit.register(_DRIVER_POOL.close_all)
+
+
+def _wait_page_ready(driver, timeout=10):
+    """
+    Wait until the current document has finished loading; returns False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def _wait_url_changes(driver, url, timeout=10):
+    """
+    Wait until the browser navigates away from url; returns False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.url_changes(url))
+        return True
+    except TimeoutException:
+        return False
+
+
+# URL fragments that mean we are past the login page, and ones that mean we are not
+_LOGGED_IN_RE = re.compile(r"dashboard|trading|member|account|platform|terminal")
+_LOGIN_PAGE_RE = re.compile(r"login|signin")
+_AUTH_COOKIE_RE = re.compile(r"auth|session", re.I)
+_SESSION_COOKIE_RE = re.compile(r"auth|session|token|logged|user", re.I)
+_COOKIE_CHECK_INTERVAL = 5.0
+
+# Lower-case markers checked after the login form is submitted
+_SUCCESS_URL_PATTERNS = ("dashboard", "trading", "account", "home", "platform", "terminal", "member")
+_SUCCESS_TITLE_TERMS = ("dashboard", "trading", "platform", "account", "terminal")
+_TEMPORARY_ERRORS = ("temporary", "try again", "timeout", "busy", "maintenance")
+
+
+def _is_logged_in_url(url):
+    """
+    True when the URL looks like a logged-in area rather than a login page
+    """
+    return bool(_LOGGED_IN_RE.search(url)) and not _LOGIN_PAGE_RE.search(url)
+
+
+# Logged-in probe for warm Chrome profiles, returned as one JSON blob
+_LOGIN_STATE_JS = """
+return JSON.stringify({
+    url: location.href,
+    accts: document.querySelectorAll('div[class*=account], div[class*=user], div[class*=profile]').length,
+    authCookie: document.cookie.match(/auth|session/i) != null
+});
+"""
+
+
+def _short_html(driver, n=500):
+    """
+    Return the first n characters of the page markup, truncated in the browser
+    so the full DOM is never serialized across the driver connection
+    """
+    return driver.execute_script("return document.documentElement.outerHTML.slice(0, arguments[0]);", n)
+
+
+# Resolve several element groups in one round-trip. Each group is an ordered list of
+# [kind, selector] candidates; the first hit per group is returned as a WebElement,
+# and _tiers records which candidate index matched
+_FIND_LOGIN_ELEMENTS_JS = """
+const groups = arguments[0], found = {_tiers: {}};
+for (const key in groups) {
+    for (const [i, [kind, selector]] of groups[key].entries()) {
+        const el = kind === 'xpath'
+            ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(selector);
+        if (el) { found[key] = el; found._tiers[key] = i; break; }
+    }
+}
+return found;
+"""
+
+
+# First element matching a CSS selector whose own text contains any of the given
+# strings (or the first match at all when no strings are given)
+_FIND_BY_TEXT_JS = """
+const texts = arguments[1];
+return Array.from(document.querySelectorAll(arguments[0])).find(e => {
+    if (!texts.length) return true;
+    const own = Array.from(e.childNodes)
+        .filter(n => n.nodeType === Node.TEXT_NODE)
+        .map(n => n.textContent).join('');
+    return texts.some(t => own.includes(t));
+}) || null;
+"""
+
+
+def _find_by_text(driver, css, texts=()):
+    """
+    Find an element by CSS selector and text in one round-trip
+    
+    Args:
+        driver: Selenium WebDriver instance
+        css: CSS selector for candidate elements
+        texts: Strings to look for in the element's own text
+    
+    Returns:
+        Matching WebElement, or None
+    """
+    return driver.execute_script(_FIND_BY_TEXT_JS, css, list(texts))
+
+
+# Dropdown entry for a symbol: a data-symbol attribute match first, then an option-like
+# element whose trimmed text is exactly the symbol, then any div containing it
+_SYMBOL_OPTION_JS = """
+const sym = arguments[0];
+const byAttr = document.querySelector('[data-symbol="' + CSS.escape(sym) + '"]');
+if (byAttr) return byAttr;
+const exact = Array.from(document.querySelectorAll("option, li, [role='option'], div[class*='option']"))
+    .find(e => e.textContent.trim() === sym);
+if (exact) return exact;
+return Array.from(document.querySelectorAll('div')).find(e =>
+    Array.from(e.childNodes).some(n => n.nodeType === Node.TEXT_NODE && n.textContent.includes(sym))) || null;
+"""
+
+# Viewport-relative centre of an element, scrolled into view first if needed
+# (CDP mouse events use viewport coordinates, unlike WebElement.rect)
+_ELEMENT_CENTER_JS = """
+const el = arguments[0];
+let r = el.getBoundingClientRect();
+if (r.bottom < 0 || r.top > innerHeight || r.right < 0 || r.left > innerWidth) {
+    el.scrollIntoView({block: 'center'});
+    r = el.getBoundingClientRect();
+}
+return [r.left + r.width / 2, r.top + r.height / 2];
+"""
+
+# Post-submit login probe: URL, title, auth cookie, a visible logged-in element and
+# the first visible error text, all in one browser-side pass
+_LOGIN_SUCCESS_CSS = (
+    "a[href*='account'], a[href*='user'], a[href*='profile'], a[href*='logout'], "
+    "div[class*='account'], div[class*='user'], div[class*='dashboard']"
+)
+_LOGIN_ERROR_CSS = (
+    "div[class*='error'], div[class*='alert'], div[class*='notification'], "
+    "p[class*='error'], span[class*='error']"
+)
+_LOGIN_RESULT_JS = """
+const [successCss, errorCss] = arguments;
+const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+const textMatch = (sel, re) => Array.from(document.querySelectorAll(sel))
+    .find(e => visible(e) && re.test(e.innerText || e.value || ''));
+let reason = '';
+const cssHit = Array.from(document.querySelectorAll(successCss)).find(visible);
+if (cssHit) {
+    reason = cssHit.tagName.toLowerCase() + ' ' + (cssHit.getAttribute('href') || cssHit.className);
+} else {
+    const textHit = textMatch('span', /Account|Balance/) || textMatch('button, a', /Logout|Sign out/);
+    if (textHit) reason = 'text "' + textHit.innerText.trim().slice(0, 40) + '"';
+}
+const errorEl = Array.from(document.querySelectorAll(errorCss)).find(e => visible(e) && e.innerText.trim())
+    || textMatch('p, span', /incorrect|failed/);
+return {
+    success: !!reason,
+    reason: reason,
+    error: errorEl ? errorEl.innerText.trim() : null,
+    url: location.href,
+    title: document.title,
+    authCookie: /auth|session|token|logged|user/i.test(document.cookie)
+};
+"""
+
+# Every input and button on the page with the attributes the fallback login
+# classifies on, plus the element itself, in one round-trip
+_LOGIN_CANDIDATES_JS = """
+return Array.from(document.querySelectorAll('input, button')).map(e => ({
+    el: e,
+    tag: e.tagName.toLowerCase(),
+    type: (e.getAttribute('type') || (e.tagName === 'BUTTON' ? 'submit' : 'text')).toLowerCase(),
+    id: e.id || '',
+    name: e.getAttribute('name') || '',
+    cls: e.getAttribute('class') || '',
+    text: (e.innerText || e.value || '').trim()
+}));
+"""
+
+# Fill and submit the login form in the page; arguments are (username, password)
+_FALLBACK_LOGIN_JS = """
+var emailField = document.querySelector('input[type="text"][name*="login"], input[type="email"], input[id*="login"], input[name*="email"], form input[type="text"]:first-of-type');
+var passwordField = document.querySelector('input[type="password"]');
+var submitButton = document.querySelector('input[type="submit"], button[type="submit"], button.login, form button');
+
+if (emailField && passwordField) {
+    emailField.value = arguments[0];
+    passwordField.value = arguments[1];
+    
+    if (submitButton) {
+        submitButton.click();
+        return "Button clicked";
+    } else if (document.forms.length > 0) {
+        document.forms[0].submit();
+        return "Form submitted";
+    }
+}
+
+return "Login elements not found";
+"""
+
+# Trading form elements by id, resolved in one round-trip (missing ones are null)
+_TRADE_ELEMENTS_JS = """
+const found = {};
+for (const id of ['symbol', 'quantity', 'stopLoss', 'takeProfit', 'buyButton', 'sellButton']) {
+    found[id] = document.getElementById(id);
+}
+return found;
+"""
+
+# A unique CSS selector (by id or name) for each element, or null when there is none
+_SELECTORS_FOR_JS = """
+return arguments[0].map(e => {
+    if (!e) return null;
+    const tag = e.tagName.toLowerCase();
+    const candidates = [];
+    if (e.id) candidates.push('#' + CSS.escape(e.id));
+    if (e.getAttribute('name')) candidates.push(tag + '[name="' + CSS.escape(e.getAttribute('name')) + '"]');
+    return candidates.find(sel => document.querySelectorAll(sel).length === 1) || null;
+});
+"""
+
+# Login form locators as ordered (kind, selector) tiers for _FIND_LOGIN_ELEMENTS_JS.
+# Each compound CSS tier covers every specific candidate in one query; the generic
+# form fallbacks are separate tiers so they never win over a specific match that
+# appears later in the document.
+_USERNAME_CSS = (
+    "#amember-login, input[name='amember_login'], "
+    "input[type='text'][id*='login'], input[type='text'][name*='login'], "
+    "input[type='text'][placeholder*='Username'], input[type='text'][placeholder*='Email']"
+)
+_PASSWORD_CSS = (
+    "#amember-pass, input[name='amember_pass'], "
+    "input[type='password'][id*='pass'], input[type='password'][name*='pass'], "
+    "input[type='password'][placeholder*='Password']"
+)
+_BUTTON_CSS = (
+    "input[type='submit'][value='Login'], input[type='submit'], button[type='submit'], "
+    "button[class*='login'], input[class*='login']"
+)
+_BUTTON_TEXT_XPATH = "//button[contains(text(), 'Login')] | //button[contains(text(), 'Sign in')]"
+_LOGIN_FORM_CSS = f"{_USERNAME_CSS}, form input[type='text']"
+
+_USERNAME_LOCATORS = (("css", _USERNAME_CSS), ("css", "form input[type='text']"))
+_PASSWORD_LOCATORS = (("css", _PASSWORD_CSS), ("css", "form input[type='password']"))
+_BUTTON_LOCATORS = (
+    ("css", _BUTTON_CSS),
+    ("xpath", _BUTTON_TEXT_XPATH),
+    ("css", "form button, form input[type='submit']")
+)
+
+
+# Last-resort Bulenox lookup by input type and page position
+_BULENOX_POSITIONAL_LOCATORS = {
+    "username": (
+        ("css", "input[type='email']"),
+        ("css", "input[type='text'][name*='login']"),
+        ("css", "input:not([type='password']):not([type='hidden'])")
+    ),
+    "password": (("css", "input[type='password']"),),
+    "button": (("css", "button"),)
+}
+
+
 class StealthExecutor(BaseExecutor):
     """
     StealthExecutor for automated trading with anti-detection features
     """
     
+    # Re-login a cached driver after this many seconds
+    _SESSION_MAX_AGE = 30 * 60
+    
+    # Shared writer threads so screenshot and trade-log I/O stays off the browser path
+    _io_pool = ThreadPoolExecutor(max_workers=2)
+    
+    # Chrome options per browser configuration (see _pool_key), built on first use
+    _options_cache = {}
+    
     def __init__(self, signal, stopLoss=None, takeProfit=None, stealth_level=2):
         """
         Initialize StealthExecutor with stealth features
@@ -30,44 +672,31 @@ class StealthExecutor(BaseExecutor):
             stealth_level: Level of stealth (1-3, where 3 is most stealthy)
         """
         super().__init__(signal, stopLoss, takeProfit)
-        # Load environment variables
-        load_dotenv()
-        
-        # Get credentials from environment variables
-        self.username = os.getenv('BROKER_USERNAME')
-        self.password = os.getenv('BROKER_PASSWORD')
-        self.broker_url = os.getenv('BROKER_URL')
+        # Credentials and browser settings are read from the environment once per process
+        cfg = _broker_cfg()
+        self.username = cfg.username
+        self.password = cfg.password
+        self.broker_url = cfg.url
         
         # Get Chrome profile settings
-        self.profile_path = os.getenv('BULENOX_PROFILE_PATH')
-        self.profile_name = os.getenv('BULENOX_PROFILE_NAME')
-        
-        # Debug output for URL
-        print(f"Broker URL: {self.broker_url}")
-        print(f"Using Chrome profile: {self.profile_path}/{self.profile_name}")
-        
-        # Ensure broker_url is a string
-        if self.broker_url is None:
-            self.broker_url = "https://bulenox.com/login"
-            print(f"Using default broker URL: {self.broker_url}")
+        self.profile_path = cfg.profile_path
+        self.profile_name = cfg.profile_name
         
         # Stealth settings
         self.stealth_level = min(max(stealth_level, 1), 3)  # Ensure between 1-3
         self.user_agent = self._get_random_user_agent()
-        self.proxy = os.getenv('PROXY_SERVER')
+        self.proxy = cfg.proxy
         
-        # Set screenshot directory
-        self.screenshot_dir = os.path.join(os.getcwd(), "logs/screenshots")
-        # Check if screenshots directory exists and create it if it doesn't
-        if not os.path.exists(self.screenshot_dir):
-            os.makedirs(self.screenshot_dir, exist_ok=True)
-            print(f"Created screenshot directory: {self.screenshot_dir}")
-        else:
-            print(f"Using existing screenshot directory: {self.screenshot_dir}")
-        self.log_file = "logs/stealth_trades.json"
+        # Diagnostic screenshots are opt-in
+        self._debug_shots = os.getenv("DEBUG_SCREENSHOTS") == "1"
+        
+        # Set screenshot and log locations
+        self.screenshot_dir = _SCREENSHOT_DIR
+        self.log_file = _LOG_FILE
+        
+        # Ensure screenshot and log directories exist (once per process)
+        _ensure_dirs()
         
-        # Ensure log directories exist
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
     
     def _get_random_user_agent(self):
         """
@@ -81,32 +710,58 @@ class StealthExecutor(BaseExecutor):
         ]
         return random.choice(user_agents)
     
-    def _save_screenshot(self, driver, name):
+    def _save_screenshot(self, driver, name, force=False):
         """
-        Save a screenshot with error handling and print the path
+        Save a diagnostic screenshot with error handling and print the path
+        
+        Screenshots are only taken when DEBUG_SCREENSHOTS=1, unless forced
         
         Args:
             driver: Selenium WebDriver instance
             name: Name for the screenshot file
+            force: Capture even when DEBUG_SCREENSHOTS is off (trade records)
+        
+        Returns:
+            Path of the screenshot, or None if skipped or failed
         """
+        if not (self._debug_shots or force):
+            return None
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.screenshot_dir}/{name}_{timestamp}.png"
-            driver.save_screenshot(filename)
-            print(f"Screenshot saved: {filename}")
+            filename = f"{self.screenshot_dir}/{name}_{time.time_ns()}.jpg"
+            # Capture a fast-encoded JPEG over CDP and let a worker thread do the disk write
+            shot = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": 60,
+                "optimizeForSpeed": True
+            })
+            self._io_pool.submit(self._write_screenshot, filename, base64.b64decode(shot["data"]))
             return filename
         except Exception as e:
             print(f"Error saving screenshot {name}: {e}")
             return None
+    
+    @staticmethod
+    def _write_screenshot(filename, image):
+        """
+        Write screenshot bytes to disk (runs on the screenshot pool)
+        """
+        try:
+            with open(filename, "wb") as f:
+                f.write(image)
+            print(f"Screenshot saved: {filename}")
+        except OSError as e:
+            print(f"Error writing screenshot {filename}: {e}")
             
-    def _init_driver(self):
+    def _build_options(self):
         """
-        Initialize Chrome driver with stealth features and user profile
+        Build Chrome options with stealth features and user profile
         """
         chrome_options = Options()
+        # Return from driver.get() at DOMContentLoaded instead of waiting on slow
+        # third-party resources; callers wait for the elements they need
+        chrome_options.page_load_strategy = "eager"
         
-        # Basic options
-        chrome_options.add_argument("--start-maximized")
+        # Basic options (the viewport is set over CDP in _init_driver)
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
@@ -133,19 +788,29 @@ class StealthExecutor(BaseExecutor):
         
         # Higher stealth levels
         if self.stealth_level >= 3 and not (self.profile_path and self.profile_name):
-            # Randomize window size slightly
-            width = random.randint(1200, 1400)
-            height = random.randint(800, 900)
-            chrome_options.add_argument(f"--window-size={width},{height}")
-            
             # Add additional privacy options
             chrome_options.add_argument("--incognito")
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins-discovery")
         
+        return chrome_options
+    
+    def _init_driver(self):
+        """
+        Initialize Chrome driver with stealth features and user profile
+        
+        Options are built once per browser configuration and reused for every
+        driver the pool creates with that configuration
+        """
+        _lazy_selenium()
+        key = self._pool_key()
+        chrome_options = self._options_cache.get(key)
+        if chrome_options is None:
+            chrome_options = self._options_cache[key] = self._build_options()
+        
         try:
             # Get chromedriver path from environment variable
-            chromedriver_path = os.getenv('CHROMEDRIVER_PATH')
+            chromedriver_path = _broker_cfg().chromedriver_path
             
             # Check if chromedriver path exists
             if chromedriver_path and os.path.exists(chromedriver_path):
@@ -157,6 +822,24 @@ class StealthExecutor(BaseExecutor):
                 print("Chromedriver path not found or invalid. Using default chromedriver.")
                 driver = webdriver.Chrome(options=chrome_options)
             
+            # Set the viewport once over CDP instead of maximizing/resizing the window
+            width, height = 1280, 800
+            if self.stealth_level >= 3 and not (self.profile_path and self.profile_name):
+                # Randomize viewport size slightly
+                width = random.randint(1200, 1400)
+                height = random.randint(800, 900)
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 1,
+                "mobile": False
+            })
+            
+            # Skip images, fonts, media and trackers the login/trade flow never needs
+            if self.stealth_level <= 2:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URLS)})
+            
             # Execute CDP commands to add additional stealth
             if self.stealth_level >= 2 and not (self.profile_path and self.profile_name):
                 driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
@@ -170,7 +853,9 @@ class StealthExecutor(BaseExecutor):
             print(f"Error initializing driver: {e}")
             # Fallback to basic options
             chrome_options = Options()
-            chrome_options.add_argument("--start-maximized")
+            chrome_options.page_load_strategy = "eager"
+            # Fixed window size, matching the viewport the primary path sets over CDP
+            chrome_options.add_argument("--window-size=1280,800")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             try:
@@ -180,14 +865,103 @@ class StealthExecutor(BaseExecutor):
                 print(f"Failed to initialize driver with fallback options: {e2}")
                 raise Exception(f"Could not initialize Chrome driver: {e2}")
     
-    def _humanlike_typing(self, element, text):
+    def _pool_key(self):
+        """
+        Drivers are only interchangeable between executors with the same browser setup
+        and broker account, so a pooled driver's cookies never reach another account
+        """
+        uses_profile = bool(self.profile_path and self.profile_name)
+        return (uses_profile, self.profile_path, self.profile_name, self.proxy, self.stealth_level, self.username)
+    
+    def acquire_driver(self):
+        """
+        Lease a warm Chrome session from the shared pool
+        """
+        return _DRIVER_POOL.acquire(self._pool_key(), self._init_driver)
+    
+    def release_driver(self, driver):
+        """
+        Return a leased Chrome session to the shared pool
+        
+        Cookies are kept: the pool key includes the broker account, so the next
+        lease is for the same account and can reuse the broker login, whether
+        or not the session is backed by a Chrome profile
+        """
+        _DRIVER_POOL.release(self._pool_key(), driver, clear_cookies=False)
+    
+    def _get_authenticated_driver(self, not_before=None):
+        """
+        Lease a logged-in driver from the pool, logging in again when the leased
+        driver has no login or its login is older than _SESSION_MAX_AGE
+        
+        Logins survive release_driver() for every pooled driver; a driver released
+        with its cookies cleared has its recorded login dropped with them.
+        
+        The caller owns the lease and must hand the driver back with release_driver().
+        
+        Args:
+            not_before: Optional time.monotonic() deadline; a new login waits for it
+                after the driver is leased, so a stealth delay overlaps Chrome start-up
+        """
+        driver = self.acquire_driver()
+        try:
+            driver.current_url
+        except Exception:
+            # Browser went away; drop it and start over
+            _DRIVER_POOL.discard(driver)
+            driver = self.acquire_driver()
+        authenticated_at = _DRIVER_POOL.authenticated_at(driver)
+        if authenticated_at is not None and time.monotonic() - authenticated_at < self._SESSION_MAX_AGE:
+            return driver
+        
+        if not_before is not None:
+            time.sleep(max(0.0, not_before - time.monotonic()))
+        if not self._login(driver):
+            self.release_driver(driver)
+            raise Exception("Failed to login to broker")
+        _DRIVER_POOL.mark_authenticated(driver)
+        return driver
+    
+    def close(self):
+        """
+        Kept for callers that close executors; drivers are returned to the pool
+        after every trade and health check, so there is nothing left to release
+        """
+    
+    @contextlib.contextmanager
+    def driver_session(self):
         """
-        Type text like a human with random delays between keystrokes
+        Context manager that leases a pooled driver and always hands it back
         """
-        for char in text:
-            element.send_keys(char)
-            # Random delay between keystrokes
-            time.sleep(random.uniform(0.05, 0.2))
+        driver = self.acquire_driver()
+        try:
+            yield driver
+        finally:
+            self.release_driver(driver)
+    
+    def _fast_type(self, driver, element, text, humanlike=False):
+        """
+        Type text into an element with as few driver round-trips as possible
+        
+        Args:
+            driver: Selenium WebDriver instance
+            element: Input element to type into
+            text: Text to type
+            humanlike: Focus the field and feed it through Chrome's input pipeline
+                via CDP rather than a plain send_keys
+        """
+        if not humanlike:
+            element.send_keys(text)
+            return
+        
+        element.click()
+        if self.stealth_level >= 3:
+            # Keystroke-level events for the most paranoid runs; CDP serializes
+            # them, so no Python-side sleeps are needed between characters
+            for char in text:
+                driver.execute_cdp_cmd("Input.dispatchKeyEvent", {"type": "char", "text": char})
+        else:
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
     
     def _humanlike_movement(self, driver, element):
         """
@@ -195,11 +969,15 @@ class StealthExecutor(BaseExecutor):
         Simplified to avoid 'move target out of bounds' errors
         """
         try:
-            # Simple direct movement to element with a single action
-            actions = ActionChains(driver)
-            actions.move_to_element(element)
-            actions.pause(random.uniform(0.1, 0.3))
-            actions.perform()
+            # One round-trip for the element's viewport centre, one CDP mouse move
+            cx, cy = driver.execute_script(_ELEMENT_CENTER_JS, element)
+            driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                "type": "mouseMoved",
+                "x": cx,
+                "y": cy,
+                "button": "none"
+            })
+            time.sleep(random.uniform(0.1, 0.3))
             return True
         except Exception as e:
             print(f"Humanlike movement error: {e}")
@@ -216,6 +994,7 @@ class StealthExecutor(BaseExecutor):
         """
         Login to broker with stealth features
         """
+        _lazy_selenium()
         try:
             # Ensure broker_url is a string
             if not isinstance(self.broker_url, str):
@@ -227,20 +1006,26 @@ class StealthExecutor(BaseExecutor):
             print(f"Navigating to broker URL: {self.broker_url}")
             driver.get(self.broker_url)
             
+            # Wait until we either land on a logged-in page or the login form renders
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(EC.any_of(
+                    EC.url_matches(_LOGGED_IN_RE.pattern),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
+                ))
+            except TimeoutException:
+                print("Login page did not settle within 10 seconds, continuing")
+            
             # Take screenshot after navigation
             self._save_screenshot(driver, "login_navigation")
             
-            # Random delay before starting login
-            time.sleep(random.uniform(1.0, 3.0))
-            
             # Check if already logged in
-            if any(pattern in driver.current_url for pattern in ["dashboard", "trading", "member", "account", "platform", "terminal"]):
-                if "login" not in driver.current_url and "signin" not in driver.current_url:
-                    print(f"Already logged in - detected from URL: {driver.current_url}")
-                    return True
+            current_url = driver.current_url
+            if _is_logged_in_url(current_url):
+                print(f"Already logged in - detected from URL: {current_url}")
+                return True
                     
             # Specialized approach for Bulenox login
-            if "bulenox.com" in driver.current_url:
+            if "bulenox.com" in current_url:
                 try:
                     print("Using specialized approach for Bulenox login")
                     # Save screenshot of initial page
@@ -361,19 +1146,20 @@ class StealthExecutor(BaseExecutor):
                     })
                     """
                     
+                    pre_submit_url = driver.current_url
                     result = driver.execute_script(js_login, self.username, self.password)
                     print(f"JavaScript login result: {result}")
                     
                     # Wait for login to complete
-                    time.sleep(5)
+                    _wait_url_changes(driver, pre_submit_url)
                     self._save_screenshot(driver, "bulenox_js_login_attempt")
                     
                     # Check if login was successful
-                    if any(pattern in driver.current_url for pattern in ["dashboard", "trading", "member", "account", "platform", "terminal"]):
-                        if "login" not in driver.current_url and "signin" not in driver.current_url:
-                            print(f"JavaScript login successful - detected from URL: {driver.current_url}")
-                            self._save_screenshot(driver, "bulenox_login_success")
-                            return True
+                    current_url = driver.current_url
+                    if _is_logged_in_url(current_url):
+                        print(f"JavaScript login successful - detected from URL: {current_url}")
+                        self._save_screenshot(driver, "bulenox_login_success")
+                        return True
                     
                     # If JavaScript approach didn't work, try a more direct approach
                     print("JavaScript login approach didn't succeed, trying direct form submission")
@@ -382,30 +1168,28 @@ class StealthExecutor(BaseExecutor):
                     try:
                         # Refresh the page to ensure we have a clean state
                         driver.refresh()
-                        time.sleep(3)
-                        
-                        # Try to find elements by explicit XPath
-                        username_xpath = "//input[@type='text' or @type='email'][1]"
-                        password_xpath = "//input[@type='password'][1]"
-                        submit_xpath = "//button[@type='submit' or contains(text(), 'Login') or contains(text(), 'Sign In')][1]"
+                        _wait_page_ready(driver)
                         
-                        username_field = driver.find_element(By.XPATH, username_xpath)
-                        password_field = driver.find_element(By.XPATH, password_xpath)
+                        # Try to find elements by explicit CSS selectors
+                        username_field = driver.find_element(By.CSS_SELECTOR, "input[type='text'], input[type='email']")
+                        password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
                         
                         # Clear and fill fields
                         username_field.clear()
-                        self._humanlike_typing(username_field, self.username)
+                        self._fast_type(driver, username_field, self.username, humanlike=True)
                         time.sleep(0.5)
                         
                         password_field.clear()
-                        self._humanlike_typing(password_field, self.password)
+                        self._fast_type(driver, password_field, self.password, humanlike=True)
                         time.sleep(0.5)
                         
                         self._save_screenshot(driver, "bulenox_direct_pre_submit")
+                        pre_submit_url = driver.current_url
                         
                         # Try to find and click submit button
                         try:
-                            submit_button = driver.find_element(By.XPATH, submit_xpath)
+                            submit_button = (_find_by_text(driver, "button[type='submit']")
+                                             or _find_by_text(driver, "button", ("Login", "Sign In")))
                             submit_button.click()
                             print("Clicked submit button directly")
                         except:
@@ -413,15 +1197,15 @@ class StealthExecutor(BaseExecutor):
                             print("Submit button not found, trying Enter key")
                             password_field.send_keys(Keys.RETURN)
                         
-                        time.sleep(5)
+                        _wait_url_changes(driver, pre_submit_url)
                         self._save_screenshot(driver, "bulenox_direct_post_submit")
                         
                         # Check if login was successful
-                        if any(pattern in driver.current_url for pattern in ["dashboard", "trading", "member", "account", "platform", "terminal"]):
-                            if "login" not in driver.current_url and "signin" not in driver.current_url:
-                                print(f"Direct login successful - detected from URL: {driver.current_url}")
-                                self._save_screenshot(driver, "bulenox_login_success")
-                                return True
+                        current_url = driver.current_url
+                        if _is_logged_in_url(current_url):
+                            print(f"Direct login successful - detected from URL: {current_url}")
+                            self._save_screenshot(driver, "bulenox_login_success")
+                            return True
                     except Exception as e:
                         print(f"Direct login approach error: {str(e)}")
                 except Exception as e:
@@ -432,29 +1216,36 @@ class StealthExecutor(BaseExecutor):
             # Check for trading elements or account info that would indicate we're logged in
             if self.profile_path and self.profile_name:
                 try:
-                    # Wait a bit for the page to fully load
-                    time.sleep(random.uniform(3.0, 5.0))
+                    # Wait for the page to fully load
+                    _wait_page_ready(driver)
+                    
+                    # Gather URL, logged-in elements and script-visible auth cookies in one round-trip
+                    state = json.loads(driver.execute_script(_LOGIN_STATE_JS))
+                    current_url = state["url"]
                     
                     # Check if we're on a page that requires login
-                    if "login" not in driver.current_url and "sign-in" not in driver.current_url:
-                        print(f"Not on login page, current URL: {driver.current_url}")
-                        # Try to find elements that would only be visible when logged in
-                        account_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'account') or contains(@class, 'user') or contains(@class, 'profile')]")
-                        if len(account_elements) > 0:
-                            print(f"Already logged in via Chrome profile - found {len(account_elements)} account elements")
+                    if "login" not in current_url and "sign-in" not in current_url:
+                        print(f"Not on login page, current URL: {current_url}")
+                        # Elements that would only be visible when logged in
+                        if state["accts"] > 0:
+                            print(f"Already logged in via Chrome profile - found {state['accts']} account elements")
                             return True
                     
-                    # Check if cookies indicate we're logged in
-                    cookies = driver.get_cookies()
-                    auth_cookies = [cookie for cookie in cookies if 'auth' in cookie.get('name', '').lower() or 'session' in cookie.get('name', '').lower()]
+                    # Check if cookies indicate we're logged in; HttpOnly session cookies are
+                    # invisible to document.cookie, so only then ask the driver for the full jar
+                    if state["authCookie"]:
+                        auth_cookies = ["document.cookie"]
+                    else:
+                        cookies = driver.get_cookies()
+                        auth_cookies = [cookie.get('name') for cookie in cookies if _AUTH_COOKIE_RE.search(cookie.get('name', ''))]
                     if auth_cookies:
-                        print(f"Found authentication cookies: {[c.get('name') for c in auth_cookies]}")
+                        print(f"Found authentication cookies: {auth_cookies}")
                         # Try navigating to dashboard or trading page
                         try:
                             dashboard_url = self.broker_url.replace("login", "dashboard")
                             print(f"Attempting to navigate to dashboard: {dashboard_url}")
                             driver.get(dashboard_url)
-                            time.sleep(3)
+                            _wait_page_ready(driver)
                             if "login" not in driver.current_url:
                                 print("Successfully navigated to dashboard - already logged in")
                                 return True
@@ -466,45 +1257,31 @@ class StealthExecutor(BaseExecutor):
             # Print page title and URL for debugging
             print(f"Page title: {driver.title}")
             print(f"Current URL: {driver.current_url}")
-            print(f"Page source snippet: {driver.page_source[:200]}...")
+            print(f"Page source snippet: {_short_html(driver, 200)}...")
             
             # Wait for login form with random additional time
             wait_time = 15 + random.uniform(0, 5)
             print(f"Waiting for login form for {wait_time} seconds...")
             
-            # Try multiple locator strategies for the login form
             login_form_found = False
-            login_form_locators = [
-                (By.ID, "amember-login"),
-                (By.NAME, "amember_login"),
-                (By.XPATH, "//input[@type='text'][@name='amember_login']"),
-                (By.XPATH, "//input[@type='text' and contains(@id, 'login')]"),
-                (By.XPATH, "//input[@type='text' and contains(@name, 'login')]"),
-                (By.XPATH, "//input[@type='text' and contains(@placeholder, 'Username')]"),
-                (By.XPATH, "//input[@type='text' and contains(@placeholder, 'Email')]"),
-                (By.XPATH, "//form//input[@type='text'][1]")
-            ]
-            
-            for locator_type, locator_value in login_form_locators:
-                try:
-                    WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((locator_type, locator_value))
-                    )
-                    print(f"Login form found using locator: {locator_type}={locator_value}")
-                    login_form_found = True
-                    break
-                except:
-                    continue
+            try:
+                WebDriverWait(driver, wait_time, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _LOGIN_FORM_CSS))
+                )
+                print("Login form found")
+                login_form_found = True
+            except TimeoutException:
+                pass
             
             if not login_form_found:
                 print("Login form not found using standard locators. Taking screenshot...")
                 self._save_screenshot(driver, "login_form_not_found")
-                print(f"Page source: {driver.page_source[:500]}...")
+                print(f"Page source: {_short_html(driver)}...")
                 
                 # Try to find any input fields as a last resort
                 try:
                     print("Trying to find any input fields as a last resort...")
-                    input_fields = driver.find_elements(By.XPATH, "//input")
+                    input_fields = driver.find_elements(By.TAG_NAME, "input")
                     if len(input_fields) >= 2:
                         print(f"Found {len(input_fields)} input fields, will attempt to use them")
                         login_form_found = True
@@ -514,70 +1291,26 @@ class StealthExecutor(BaseExecutor):
                     print(f"Last resort locator failed: {e}")
                     raise Exception("Login form not found")
             
-            # Get login elements using multiple strategies
-            email_field = None
-            password_field = None
-            login_button = None
-            
-            # Try multiple locator strategies for username/email field
-            username_locators = [
-                (By.ID, "amember-login"),
-                (By.NAME, "amember_login"),
-                (By.XPATH, "//input[@type='text'][@name='amember_login']"),
-                (By.XPATH, "//input[@type='text' and contains(@id, 'login')]"),
-                (By.XPATH, "//input[@type='text' and contains(@name, 'login')]"),
-                (By.XPATH, "//input[@type='text' and contains(@placeholder, 'Username')]"),
-                (By.XPATH, "//input[@type='text' and contains(@placeholder, 'Email')]"),
-                (By.XPATH, "//form//input[@type='text'][1]")
-            ]
-            
-            for locator_type, locator_value in username_locators:
-                try:
-                    email_field = driver.find_element(locator_type, locator_value)
-                    print(f"Found username field using: {locator_type}={locator_value}")
-                    break
-                except:
-                    continue
-            
-            # Try multiple locator strategies for password field
-            password_locators = [
-                (By.ID, "amember-pass"),
-                (By.NAME, "amember_pass"),
-                (By.XPATH, "//input[@type='password'][@name='amember_pass']"),
-                (By.XPATH, "//input[@type='password' and contains(@id, 'pass')]"),
-                (By.XPATH, "//input[@type='password' and contains(@name, 'pass')]"),
-                (By.XPATH, "//input[@type='password' and contains(@placeholder, 'Password')]"),
-                (By.XPATH, "//form//input[@type='password'][1]")
-            ]
-            
-            for locator_type, locator_value in password_locators:
-                try:
-                    password_field = driver.find_element(locator_type, locator_value)
-                    print(f"Found password field using: {locator_type}={locator_value}")
-                    break
-                except:
-                    continue
-            
-            # Try multiple locator strategies for login button
-            button_locators = [
-                (By.XPATH, "//input[@type='submit'][@value='Login']"),
-                (By.XPATH, "//input[@type='submit']"),
-                (By.XPATH, "//button[@type='submit']"),
-                (By.XPATH, "//button[contains(text(), 'Login')]"),
-                (By.XPATH, "//button[contains(text(), 'Sign in')]"),
-                (By.XPATH, "//button[contains(@class, 'login')]"),
-                (By.XPATH, "//input[contains(@class, 'login')]"),
-                (By.XPATH, "//form//button[1]"),
-                (By.XPATH, "//form//input[@type='submit'][1]")
-            ]
-            
-            for locator_type, locator_value in button_locators:
-                try:
-                    login_button = driver.find_element(locator_type, locator_value)
-                    print(f"Found login button using: {locator_type}={locator_value}")
-                    break
-                except:
-                    continue
+            # Get all login elements in one browser-side pass, specific locators first,
+            # generic form fallbacks second
+            # Selectors that worked last time for this broker are tried first
+            cached_selectors = _cached_login_selectors(self.broker_url)
+            locator_groups = {
+                "username": _USERNAME_LOCATORS,
+                "password": _PASSWORD_LOCATORS,
+                "button": _BUTTON_LOCATORS
+            }
+            for key, css in cached_selectors.items():
+                if key in locator_groups:
+                    locator_groups[key] = (("css", css),) + locator_groups[key]
+            found = driver.execute_script(_FIND_LOGIN_ELEMENTS_JS, locator_groups) or {}
+            tiers = found.get("_tiers") or {}
+            from_cache = bool(cached_selectors) and all(tiers.get(k) == 0 for k in locator_groups)
+            email_field = found.get("username")
+            password_field = found.get("password")
+            login_button = found.get("button")
+            print(f"Login elements found: username={email_field is not None}, "
+                  f"password={password_field is not None}, button={login_button is not None}")
             
             # Check if all elements were found
             if not email_field or not password_field or not login_button:
@@ -585,83 +1318,81 @@ class StealthExecutor(BaseExecutor):
                 self._save_screenshot(driver, "login_element_not_found")
                 
                 # Try to find any input fields as a last resort
-            try:
-                print("Trying to find login elements as a last resort...")
-                input_fields = driver.find_elements(By.XPATH, "//input")
-                if len(input_fields) >= 2:
-                    # Assume first text/email input is username, first password input is password
-                    if not email_field:
-                        for i, field in enumerate(input_fields):
-                            field_type = field.get_attribute("type")
-                            field_id = field.get_attribute("id") or ""
-                            field_name = field.get_attribute("name") or ""
-                            field_class = field.get_attribute("class") or ""
-                            
-                            print(f"Input #{i+1}: type={field_type}, id={field_id}, name={field_name}, class={field_class}")
-                            
-                            if field.get_attribute("type") in ["text", "email"]:
-                                email_field = field
-                                print(f"Found username field as input #{i+1}")
-                                break
-                    
-                    if not password_field:
-                        for i, field in enumerate(input_fields):
-                            if field.get_attribute("type") == "password":
-                                password_field = field
-                                print(f"Found password field as input #{i+1}")
-                                break
-                    
-                    if not login_button:
-                        # Try to find any button or input[type=submit]
-                        buttons = driver.find_elements(By.XPATH, "//button | //input[@type='submit']")
-                        for i, button in enumerate(buttons):
-                            button_text = button.text.lower()
-                            button_type = button.get_attribute("type") or ""
-                            button_id = button.get_attribute("id") or ""
-                            button_class = button.get_attribute("class") or ""
-                            
-                            print(f"Button #{i+1}: text={button.text}, type={button_type}, id={button_id}, class={button_class}")
-                            
-                            if ("login" in button_text or "sign in" in button_text or "log in" in button_text or 
-                                button_type == "submit" or "login" in button_id.lower() or "submit" in button_id.lower()):
-                                login_button = button
-                                print(f"Found login button with text: {button.text}")
-                                break
-                            elif i == 0 and buttons:  # If no better match, use first button
-                                login_button = buttons[0]
-                                print("Using first button as login button")
-                
-                # If we still can't find elements, try a more aggressive approach for Bulenox
-                if (not email_field or not password_field or not login_button) and "bulenox.com" in driver.current_url:
-                    print("Trying aggressive element finding for Bulenox")
-                    # Try to find elements by their position on the page
-                    all_inputs = driver.find_elements(By.TAG_NAME, "input")
-                    if len(all_inputs) >= 2:
-                        # Assume first input is username, second is password
-                        if not email_field and all_inputs[0].get_attribute("type") != "password":
-                            email_field = all_inputs[0]
-                            print("Found username field by position")
+                try:
+                    print("Trying to find login elements as a last resort...")
+                    # One round-trip for every input/button and the attributes we classify on
+                    candidates = driver.execute_script(_LOGIN_CANDIDATES_JS) or []
+                    inputs = [c for c in candidates if c["tag"] == "input"]
+                    debug = logger.isEnabledFor(logging.DEBUG)
+                    if len(inputs) >= 2:
+                        # Assume first text/email input is username, first password input is password
+                        if not email_field:
+                            for i, field in enumerate(inputs):
+                                if debug:
+                                    logger.debug("Input #%d: type=%s, id=%s, name=%s, class=%s",
+                                                 i + 1, field['type'], field['id'], field['name'], field['cls'])
+                                if field["type"] in ["text", "email"]:
+                                    email_field = field["el"]
+                                    print(f"Found username field as input #{i+1}")
+                                    break
+                        
                         if not password_field:
-                            for inp in all_inputs:
-                                if inp.get_attribute("type") == "password":
-                                    password_field = inp
-                                    print("Found password field by type")
+                            for i, field in enumerate(inputs):
+                                if field["type"] == "password":
+                                    password_field = field["el"]
+                                    print(f"Found password field as input #{i+1}")
                                     break
                         
-                        # Find the closest button
-                        all_buttons = driver.find_elements(By.TAG_NAME, "button")
-                        if all_buttons and not login_button:
-                            login_button = all_buttons[0]  # Assume first button is login
+                        if not login_button:
+                            # Try to find any button or input[type=submit]
+                            buttons = [c for c in candidates if c["tag"] == "button" or c["type"] == "submit"]
+                            for i, button in enumerate(buttons):
+                                button_text = button["text"].lower()
+                                button_id = button["id"].lower()
+                                if debug:
+                                    logger.debug("Button #%d: text=%s, type=%s, id=%s, class=%s",
+                                                 i + 1, button['text'], button['type'], button['id'], button['cls'])
+                                if ("login" in button_text or "sign in" in button_text or "log in" in button_text or
+                                    button["type"] == "submit" or "login" in button_id or "submit" in button_id):
+                                    login_button = button["el"]
+                                    print(f"Found login button with text: {button['text']}")
+                                    break
+                                elif i == 0:  # If no better match, use first button
+                                    login_button = buttons[0]["el"]
+                                    print("Using first button as login button")
+                    
+                    # If we still can't find elements, try a more aggressive approach for Bulenox
+                    if (not email_field or not password_field or not login_button) and "bulenox.com" in driver.current_url:
+                        print("Trying aggressive element finding for Bulenox")
+                        # Resolve all three by type/position in one browser-side pass
+                        found = driver.execute_script(_FIND_LOGIN_ELEMENTS_JS, _BULENOX_POSITIONAL_LOCATORS) or {}
+                        if not email_field and found.get("username"):
+                            email_field = found["username"]
+                            print("Found username field by position")
+                        if not password_field and found.get("password"):
+                            password_field = found["password"]
+                            print("Found password field by type")
+                        if not login_button and found.get("button"):
+                            login_button = found["button"]  # Assume first button is login
                             print("Found login button by position")
                 
-                if not email_field or not password_field or not login_button:
-                    raise Exception("Could not find all required login elements")
-            except Exception as e:
-                print(f"Last resort element finding failed: {e}")
-                raise
+                    if not email_field or not password_field or not login_button:
+                        raise Exception("Could not find all required login elements")
+                except Exception as e:
+                    print(f"Last resort element finding failed: {e}")
+                    raise
             
             print("All login elements found")
             
+            # Remember where the elements were so the next login can go straight to them
+            resolved_selectors = None
+            if not from_cache:
+                try:
+                    resolved_selectors = driver.execute_script(
+                        _SELECTORS_FOR_JS, [email_field, password_field, login_button])
+                except Exception as e:
+                    print(f"Could not derive login selectors: {e}")
+            
             # Print credentials for debugging (masked)
             print(f"Using username: {self.username[:3]}{'*' * (len(self.username) - 3)}")
             print(f"Using password: {'*' * len(self.password)}")
@@ -674,9 +1405,9 @@ class StealthExecutor(BaseExecutor):
                 
                 # Type credentials with humanlike typing if stealth level is high
                 if self.stealth_level >= 2:
-                    self._humanlike_typing(email_field, self.username)
+                    self._fast_type(driver, email_field, self.username, humanlike=True)
                     time.sleep(random.uniform(0.5, 1.0))
-                    self._humanlike_typing(password_field, self.password)
+                    self._fast_type(driver, password_field, self.password, humanlike=True)
                 else:
                     # Type credentials directly
                     email_field.send_keys(self.username)
@@ -700,33 +1431,9 @@ class StealthExecutor(BaseExecutor):
                 # Try fallback login method with dynamic element finding
                 try:
                     print("Trying fallback login method...")
-                    # Create a JavaScript string with proper escaping
-                    js_login = f"""
-                    (function() {{
-                      var emailField = document.querySelector('input[type="text"][name*="login"], input[type="email"], input[id*="login"], input[name*="email"], form input[type="text"]:first-of-type');
-                      var passwordField = document.querySelector('input[type="password"]');
-                      var submitButton = document.querySelector('input[type="submit"], button[type="submit"], button.login, form button');
-                      
-                      if (emailField && passwordField) {{
-                        emailField.value = "{self.username}";
-                        passwordField.value = "{self.password}";
-                        
-                        if (submitButton) {{
-                          submitButton.click();
-                          return "Button clicked";
-                        }} else if (document.forms.length > 0) {{
-                          var form = document.forms[0];
-                          form.submit();
-                          return "Form submitted";
-                        }}
-                      }}
-                      
-                      return "Login elements not found";
-                    }})()
-                    """
-                    
-                    driver.execute_script(js_login)
-                    print("Fallback login script executed")
+                    # Credentials go in as script arguments, never into the source
+                    result = driver.execute_script(_FALLBACK_LOGIN_JS, self.username, self.password)
+                    print(f"Fallback login script executed: {result}")
                 except Exception as e2:
                     print(f"Fallback login failed: {e2}")
                     return False
@@ -739,130 +1446,87 @@ class StealthExecutor(BaseExecutor):
                 initial_url = driver.current_url
                 print(f"Initial URL before login: {initial_url}")
                 
-                # Define success indicators
-                success_url_patterns = ["dashboard", "trading", "account", "home", "platform", "terminal", "member"]
-                success_element_patterns = [
-                    "//a[contains(@href, 'account') or contains(@href, 'user') or contains(@href, 'profile') or contains(@href, 'logout')]",
-                    "//div[contains(@class, 'account') or contains(@class, 'user')]",
-                    "//span[contains(text(), 'Account') or contains(text(), 'Balance')]",
-                    "//button[contains(text(), 'Logout') or contains(text(), 'Sign out')]",
-                    "//a[contains(text(), 'Logout') or contains(text(), 'Sign out')]",
-                    "//div[contains(@class, 'dashboard')]",
-                    "//div[contains(@class, 'member-dashboard')]"
-                ]
-                
-                # Define error indicators
-                error_patterns = [
-                    "//div[contains(@class, 'error') or contains(@class, 'alert') or contains(@class, 'notification')]",
-                    "//p[contains(@class, 'error') or contains(text(), 'incorrect') or contains(text(), 'failed')]",
-                    "//span[contains(@class, 'error') or contains(text(), 'incorrect') or contains(text(), 'failed')]"
-                ]
+                tried_dashboard = []
+                last_cookie_check = [time.monotonic()]
                 
-                # Wait for URL to change or dashboard element to appear
-                start_time = time.time()
-                login_success = False
-                
-                while time.time() - start_time < wait_time:
+                def _check(d):
+                    """
+                    One browser round-trip per poll: URL, title, auth cookie,
+                    success element and error text are all read by _LOGIN_RESULT_JS
+                    """
                     try:
-                        current_url = driver.current_url
-                        print(f"Current URL: {current_url}")
+                        state = d.execute_script(_LOGIN_RESULT_JS, _LOGIN_SUCCESS_CSS, _LOGIN_ERROR_CSS)
+                        current_url = state["url"].lower()
                         
-                        # Check if URL changed from initial login page
-                        if current_url != initial_url and not "login" in current_url.lower():
-                            print("URL changed from login page")
-                            
-                            # Check for success URL patterns
-                            for pattern in success_url_patterns:
-                                if pattern in current_url.lower():
+                        # URL changed away from the login page to a known area
+                        if state["url"] != initial_url and "login" not in current_url:
+                            for pattern in _SUCCESS_URL_PATTERNS:
+                                if pattern in current_url:
                                     print(f"Login successful - redirected to URL containing '{pattern}'")
-                                    login_success = True
-                                    break
+                                    return "success"
                         
-                        # If URL check found success, break the main loop
-                        if login_success:
-                            break
+                        if state["success"]:
+                            print(f"Login successful - found logged-in element: {state['reason']}")
+                            return "success"
                         
-                        # Check for success elements
-                        for xpath in success_element_patterns:
-                            try:
-                                elements = driver.find_elements(By.XPATH, xpath)
-                                if elements and any(e.is_displayed() for e in elements):
-                                    print(f"Login successful - found element matching: {xpath}")
-                                    login_success = True
-                                    break
-                            except Exception as e:
-                                print(f"Error checking success element {xpath}: {e}")
+                        # Auth cookie but still on the login page: try the dashboard once.
+                        # HttpOnly cookies are invisible to the probe, so check the full
+                        # jar as well, but at most every _COOKIE_CHECK_INTERVAL seconds
+                        has_auth_cookie = state["authCookie"]
+                        if not has_auth_cookie and "login" in current_url and not tried_dashboard:
+                            now = time.monotonic()
+                            if now - last_cookie_check[0] >= _COOKIE_CHECK_INTERVAL:
+                                last_cookie_check[0] = now
+                                has_auth_cookie = any(_SESSION_COOKIE_RE.search(c.get('name', ''))
+                                                      for c in d.get_cookies())
+                        if has_auth_cookie and "login" in current_url and not tried_dashboard:
+                            tried_dashboard.append(True)
+                            print("Found authentication-related cookie, trying dashboard")
+                            d.get(state["url"].split('/login')[0] + '/dashboard')
+                            _wait_page_ready(d)
+                            if "login" not in d.current_url.lower():
+                                print("Successfully navigated to dashboard after finding auth cookies")
+                                return "success"
                         
-                        # If element check found success, break the main loop
-                        if login_success:
-                            break
+                        error_text = state["error"]
+                        if error_text:
+                            if any(temp in error_text.lower() for temp in _TEMPORARY_ERRORS):
+                                logger.debug("Temporary login error, will continue waiting: %s", error_text)
+                            else:
+                                print(f"Login error detected: {error_text}")
+                                return "error"
                         
-                        # Check for authentication cookies
-                        cookies = driver.get_cookies()
-                        auth_cookies = [c for c in cookies if any(auth_term in c['name'].lower() 
-                                                                for auth_term in ['auth', 'session', 'token', 'logged', 'user'])]
-                        if auth_cookies:
-                            print(f"Found {len(auth_cookies)} authentication-related cookies")
-                            # If we have auth cookies but still on login page, try navigating to dashboard
-                            if "login" in current_url.lower():
-                                try:
-                                    # Try to navigate to a dashboard or home page
-                                    driver.get(driver.current_url.split('/login')[0] + '/dashboard')
-                                    time.sleep(2)
-                                    if "login" not in driver.current_url.lower():
-                                        print("Successfully navigated to dashboard after finding auth cookies")
-                                        login_success = True
-                                        break
-                                except:
-                                    pass
-                        
-                        # Check for error messages
-                        for xpath in error_patterns:
-                            try:
-                                error_elements = driver.find_elements(By.XPATH, xpath)
-                                for error in error_elements:
-                                    if error.is_displayed() and error.text.strip():
-                                        error_text = error.text.strip()
-                                        print(f"Login error detected: {error_text}")
-                                        self._save_screenshot(driver, "login_error")
-                                        
-                                        # Check if it's a temporary error that might resolve with retry
-                                        temporary_errors = ["temporary", "try again", "timeout", "busy", "maintenance"]
-                                        if any(temp in error_text.lower() for temp in temporary_errors):
-                                            print("Detected temporary error, will continue waiting")
-                                        else:
-                                            return False
-                            except Exception as e:
-                                print(f"Error checking error elements {xpath}: {e}")
+                        page_title = state["title"].lower()
+                        if any(term in page_title for term in _SUCCESS_TITLE_TERMS):
+                            print(f"Login successful - page title indicates success: {state['title']}")
+                            return "success"
                     except Exception as e:
-                        print(f"Error during login completion check: {e}")
-                    
-                    # Check page title for additional clues
-                    try:
-                        page_title = driver.title
-                        print(f"Current page title: {page_title}")
-                        
-                        # Check if title indicates success
-                        success_title_terms = ["dashboard", "trading", "platform", "account", "terminal"]
-                        if any(term in page_title.lower() for term in success_title_terms):
-                            print(f"Login successful - page title indicates success: {page_title}")
-                            login_success = True
-                            break
-                    except Exception as e:
-                        print(f"Error checking page title: {e}")
-                    
-                    time.sleep(1)
+                        logger.debug("Error during login completion check: %s", e)
+                    return False
+                
+                login_success = False
+                try:
+                    result = WebDriverWait(driver, wait_time, poll_frequency=0.25).until(_check)
+                    if result == "error":
+                        self._save_screenshot(driver, "login_error")
+                        return False
+                    login_success = True
+                except TimeoutException:
+                    pass
                 
                 if not login_success:
                     print("Login timed out without success or error")
                     self._save_screenshot(driver, "login_error")
                     
                     # As a last resort, check if we're not on a login page anymore
-                    if initial_url != driver.current_url and "login" not in driver.current_url.lower():
+                    final_url = driver.current_url
+                    if initial_url != final_url and "login" not in final_url.lower():
                         print("URL changed from login page and not on login page - assuming success")
                         login_success = True
                 
                 print(f"Login completed with result: {login_success}")
+                if login_success and resolved_selectors and all(resolved_selectors):
+                    _store_login_selectors(self.broker_url, dict(zip(("username", "password", "button"), resolved_selectors)))
                 return login_success
             
             except Exception as e:
@@ -879,6 +1543,7 @@ class StealthExecutor(BaseExecutor):
         """
         Place a trade with stealth features
         """
+        _lazy_selenium()
         try:
             # Navigate to trading page
             trading_url = self.broker_url.replace("login", "trading")
@@ -893,22 +1558,24 @@ class StealthExecutor(BaseExecutor):
             # Take screenshot of trading page
             self._save_screenshot(driver, "trading_page")
             
-            # Get trading elements
-            symbol_input = driver.find_element(By.ID, "symbol")
-            quantity_input = driver.find_element(By.ID, "quantity")
+            # Get all trading elements in one round-trip
+            trade_els = driver.execute_script(_TRADE_ELEMENTS_JS) or {}
+            symbol_input = trade_els["symbol"]
+            quantity_input = trade_els["quantity"]
+            if not quantity_input:
+                raise NoSuchElementException("quantity input not found")
             
             # Enter symbol with stealth features
             if self.stealth_level >= 2:
                 self._humanlike_movement(driver, symbol_input)
                 symbol_input.clear()
-                self._humanlike_typing(symbol_input, self.signal["symbol"])
+                self._fast_type(driver, symbol_input, self.signal["symbol"], humanlike=True)
                 
                 # Select symbol from dropdown if needed
                 try:
-                    WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, f"//div[contains(text(), '{self.signal['symbol']}')]"))
+                    symbol_option = WebDriverWait(driver, 5).until(
+                        lambda d: d.execute_script(_SYMBOL_OPTION_JS, self.signal["symbol"])
                     )
-                    symbol_option = driver.find_element(By.XPATH, f"//div[contains(text(), '{self.signal['symbol']}')]")
                     self._humanlike_movement(driver, symbol_option)
                     symbol_option.click()
                 except (TimeoutException, NoSuchElementException):
@@ -925,29 +1592,33 @@ class StealthExecutor(BaseExecutor):
             if self.stealth_level >= 2:
                 self._humanlike_movement(driver, quantity_input)
                 quantity_input.clear()
-                self._humanlike_typing(quantity_input, str(self.signal["quantity"]))
+                self._fast_type(driver, quantity_input, str(self.signal["quantity"]), humanlike=True)
             else:
                 quantity_input.clear()
                 quantity_input.send_keys(str(self.signal["quantity"]))
             
             # Enter stop loss if provided
             if self.stopLoss:
-                sl_input = driver.find_element(By.ID, "stopLoss")
+                sl_input = trade_els["stopLoss"]
+                if not sl_input:
+                    raise NoSuchElementException("stopLoss input not found")
                 if self.stealth_level >= 2:
                     self._humanlike_movement(driver, sl_input)
                     sl_input.clear()
-                    self._humanlike_typing(sl_input, str(self.stopLoss))
+                    self._fast_type(driver, sl_input, str(self.stopLoss), humanlike=True)
                 else:
                     sl_input.clear()
                     sl_input.send_keys(str(self.stopLoss))
             
             # Enter take profit if provided
             if self.takeProfit:
-                tp_input = driver.find_element(By.ID, "takeProfit")
+                tp_input = trade_els["takeProfit"]
+                if not tp_input:
+                    raise NoSuchElementException("takeProfit input not found")
                 if self.stealth_level >= 2:
                     self._humanlike_movement(driver, tp_input)
                     tp_input.clear()
-                    self._humanlike_typing(tp_input, str(self.takeProfit))
+                    self._fast_type(driver, tp_input, str(self.takeProfit), humanlike=True)
                 else:
                     tp_input.clear()
                     tp_input.send_keys(str(self.takeProfit))
@@ -957,7 +1628,9 @@ class StealthExecutor(BaseExecutor):
             
             # Click buy or sell button
             button_id = "buyButton" if self.signal["side"].lower() == "buy" else "sellButton"
-            trade_button = driver.find_element(By.ID, button_id)
+            trade_button = trade_els[button_id]
+            if not trade_button:
+                raise NoSuchElementException(f"{button_id} not found")
             
             if self.stealth_level >= 2:
                 self._humanlike_movement(driver, trade_button)
@@ -966,10 +1639,9 @@ class StealthExecutor(BaseExecutor):
             
             # Handle confirmation dialog if present
             try:
-                WebDriverWait(driver, 5).until(
+                confirm_button = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.ID, "confirmButton"))
                 )
-                confirm_button = driver.find_element(By.ID, "confirmButton")
                 
                 if self.stealth_level >= 2:
                     self._humanlike_movement(driver, confirm_button)
@@ -981,7 +1653,7 @@ class StealthExecutor(BaseExecutor):
             
             # Wait for trade confirmation
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Trade executed successfully')]"))
+                lambda d: _find_by_text(d, "div", ("Trade executed successfully",))
             )
             
             # Take screenshot of confirmation
@@ -995,17 +1667,9 @@ class StealthExecutor(BaseExecutor):
     
     def _log_trade(self, success):
         """
-        Log trade details to JSON file
+        Append trade details to this executor's trade log
         """
         try:
-            # Load existing trades
-            try:
-                with open(self.log_file, "r") as f:
-                    trades = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                trades = []
-            
-            # Add new trade
             trade_record = {
                 "timestamp": datetime.datetime.now().isoformat(),
                 "symbol": self.signal["symbol"],
@@ -1016,12 +1680,7 @@ class StealthExecutor(BaseExecutor):
                 "stealth_level": self.stealth_level,
                 "success": success
             }
-            trades.append(trade_record)
-            
-            # Save updated trades
-            with open(self.log_file, "w") as f:
-                json.dump(trades, f, indent=2)
-                
+            _append_trade_log(trade_record, self.log_file)
             return True
         except Exception as e:
             print(f"Error logging trade: {e}")
@@ -1031,49 +1690,40 @@ class StealthExecutor(BaseExecutor):
         """
         Execute a trade with stealth features
         """
-        driver = None
-        success = False
-        
         try:
-            # Initialize driver with stealth features
-            driver = self._init_driver()
-            
-            # Random delay before starting
-            time.sleep(random.uniform(1.0, 3.0))
+            # Random delay before starting, spent while the driver is leased/started
+            not_before = time.monotonic() + random.uniform(1.0, 3.0)
             
-            # Login to broker
-            if not self._login(driver):
-                raise Exception("Failed to login to broker")
-            
-            # Random delay between login and trade
-            time.sleep(random.uniform(2.0, 5.0))
-            
-            # Place the trade
-            success = self._place_trade(driver)
+            # Reuse a logged-in pooled driver, logging in only when needed
+            driver = self._get_authenticated_driver(not_before=not_before)
+            try:
+                time.sleep(max(0.0, not_before - time.monotonic()))
+                
+                # Random delay between login and trade
+                time.sleep(random.uniform(2.0, 5.0))
+                
+                # Place the trade
+                success = self._place_trade(driver)
+            finally:
+                # Hand the driver back so other executors on this profile can use it
+                self.release_driver(driver)
             
-            # Log the trade
-            self._log_trade(success)
+            # Log the trade off the critical path
+            self._io_pool.submit(self._log_trade, success)
             
             return success
         except Exception as e:
             print(f"Trade execution failed: {e}")
-            self._log_trade(False)
+            self._io_pool.submit(self._log_trade, False)
             return False
-        finally:
-            if driver:
-                # Random delay before quitting
-                time.sleep(random.uniform(1.0, 2.0))
-                driver.quit()
     
     def health(self):
         """
         Check if the executor is healthy
         """
         try:
-            driver = self._init_driver()
-            login_success = self._login(driver)
-            driver.quit()
-            return login_success
+            self.release_driver(self._get_authenticated_driver())
+            return True
         except Exception as e:
             print(f"Health check failed: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -1,36 +1,42 @@
 from lunardate import LunarDate
 import datetime
+import functools
+
+# Phase name for each day of the lunar month (index 0 is unused)
+_PHASES = (
+    (None, 'New Moon 🌑')
+    + ('Waxing Crescent 🌒',) * 6   # days 2-7
+    + ('First Quarter 🌓',)         # day 8
+    + ('Waxing Gibbous 🌔',) * 6    # days 9-14
+    + ('Full Moon 🌕',)             # day 15
+    + ('Waning Gibbous 🌖',) * 6    # days 16-21
+    + ('Last Quarter 🌗',)          # day 22
+    + ('Waning Crescent 🌘',) * 8   # days 23-30
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _phase_for_ordinal(ordinal):
+    """
+    Lunar phase for a proleptic Gregorian ordinal, cached per day
+    """
+    date = datetime.date.fromordinal(ordinal)
+    # Convert solar date to lunar date and get the day of lunar month
+    moon_day = LunarDate.fromSolarDate(date.year, date.month, date.day).day
+    return _PHASES[moon_day]
+
 
 def get_lunar_phase(date=None):
     """
     Calculate the current lunar phase based on the lunar calendar day.
-    
+
     Args:
         date: A datetime.date object. If None, uses today's date.
-        
+
     Returns:
         A string describing the current lunar phase with an emoji.
     """
     if not date:
         date = datetime.date.today()
-    
-    # Convert solar date to lunar date and get the day of lunar month
-    moon_day = LunarDate.fromSolarDate(date.year, date.month, date.day).day
-    
-    # Determine the lunar phase based on the day of the lunar month
-    if moon_day == 1:
-        return 'New Moon 🌑'
-    elif 2 <= moon_day <= 7:
-        return 'Waxing Crescent 🌒'
-    elif moon_day == 8:
-        return 'First Quarter 🌓'
-    elif 9 <= moon_day <= 14:
-        return 'Waxing Gibbous 🌔'
-    elif moon_day == 15:
-        return 'Full Moon 🌕'
-    elif 16 <= moon_day <= 21:
-        return 'Waning Gibbous 🌖'
-    elif moon_day == 22:
-        return 'Last Quarter 🌗'
-    else:  # 23-30
-        return 'Waning Crescent 🌘'
\ No newline at end of file
+
+    return _phase_for_ordinal(date.toordinal())
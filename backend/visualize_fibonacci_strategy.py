@@ -1,23 +1,92 @@
 import os
 import sys
+import gc
 import json
 import argparse
-import matplotlib.pyplot as plt
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from operator import itemgetter
 import numpy as np
 from datetime import datetime
 
+# orjson parses much faster than the stdlib; fall back to json without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    ORJSON_AVAILABLE = False
+    JSONDecodeError = json.JSONDecodeError
+
+# numba compiles the Fibonacci level histogram; numpy is used without it.
+# Compiled code is cached on disk so restarts skip the compile
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "numba_cache"))
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Standard Fibonacci retracement levels used as histogram bins
+FIB_EDGES = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+
+def _fib_hist_loop(levels, edges):
+    """
+    Count levels falling on each edge; levels on no edge are flagged off-grid
+    """
+    counts = np.zeros(len(edges), dtype=np.int64)
+    off_grid = np.zeros(len(levels), dtype=np.bool_)
+    for i in range(len(levels)):
+        j = np.searchsorted(edges, levels[i])
+        if j < len(edges) and abs(edges[j] - levels[i]) < 1e-9:
+            counts[j] += 1
+        elif j > 0 and abs(edges[j - 1] - levels[i]) < 1e-9:
+            counts[j - 1] += 1
+        else:
+            off_grid[i] = True
+    return counts, off_grid
+
+def _fib_hist_numpy(levels, edges):
+    """
+    Vectorized equivalent of _fib_hist_loop
+    """
+    idx = np.clip(np.searchsorted(edges, levels), 1, len(edges) - 1)
+    nearest = np.where(np.abs(edges[idx - 1] - levels) <= np.abs(edges[idx] - levels), idx - 1, idx)
+    on_grid = np.abs(edges[nearest] - levels) < 1e-9
+    counts = np.bincount(nearest[on_grid], minlength=len(edges)).astype(np.int64)
+    return counts, ~on_grid
+
+_fib_hist = njit(cache=True)(_fib_hist_loop) if NUMBA_AVAILABLE else _fib_hist_numpy
+
+def warm_up():
+    """
+    Compile the numba histogram now, so the first real request doesn't pay for it
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    try:
+        _fib_hist(np.array([0.5]), FIB_EDGES)
+    except Exception as e:
+        print(f"Error warming up Fibonacci histogram: {e}")
+
 def load_trade_history(file_path="logs/fibonacci_trades.json"):
     """
     Load trade history from the logs file
     """
     try:
-        with open(file_path, 'r') as f:
-            history = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'rb') as f:
+                history = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                history = json.load(f)
         return history
     except FileNotFoundError:
         print(f"Trade history file not found: {file_path}")
         return []
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         print(f"Invalid JSON in trade history file: {file_path}")
         return []
     except Exception as e:
@@ -36,9 +105,304 @@ def parse_timestamp(timestamp):
         except:
             return datetime.now()
 
+@functools.lru_cache(maxsize=1)
+def _pyplot():
+    """
+    Import matplotlib on first render, so callers that only need compute_stats
+    never pay for it
+    
+    Returns:
+        The (matplotlib, pyplot) modules
+    """
+    import matplotlib
+    
+    # Render off-screen unless run as the interactive CLI: Agg skips GUI backend start-up
+    # and needs no display server. MPL_CAIRO=1 opts into mplcairo for nicer text.
+    if __name__ != "__main__":
+        if os.getenv("MPL_CAIRO") == "1":
+            try:
+                matplotlib.use("module://mplcairo.base")
+            except (ImportError, ValueError):
+                matplotlib.use("Agg")
+        else:
+            matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    
+    # Figures are closed explicitly, so pyplot's open-figure warning is noise
+    plt.rcParams['figure.max_open_warning'] = 0
+    return matplotlib, plt
+
+# Run a full garbage collection after every GC_EVERY visualizations
+GC_EVERY = 10
+_visualize_calls = 0
+
+def _collect_garbage():
+    """
+    Collect lingering matplotlib reference cycles every GC_EVERY calls
+    """
+    global _visualize_calls
+    _visualize_calls += 1
+    if _visualize_calls % GC_EVERY == 0:
+        gc.collect()
+
+def parse_timestamps(raw_timestamps):
+    """
+    Vectorized parse_timestamp for a whole column of timestamp strings
+    
+    Args:
+        raw_timestamps: List of timestamp strings
+    
+    Returns:
+        numpy datetime64 array; unparseable entries become the current time
+    """
+    # Fast path: numpy parses ISO-8601 (with "T" or a space) in C. Any entry it
+    # can't parse, including empty strings (NaT), sends the whole column down
+    # the format-checked pandas path below
+    try:
+        parsed = np.array(raw_timestamps, dtype="datetime64[us]")
+        if not np.isnat(parsed).any():
+            return parsed.astype("datetime64[ns]")
+    except (ValueError, TypeError):
+        pass
+    
+    # pandas is only needed on this slow path, so it is imported here
+    import pandas as pd
+    
+    raw = pd.Series(raw_timestamps, dtype=object)
+    parsed = pd.to_datetime(raw, format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    parsed = parsed.fillna(pd.to_datetime(raw, format="%Y-%m-%dT%H:%M:%S.%f", errors="coerce"))
+    return parsed.fillna(pd.Timestamp.now()).to_numpy()
+
+def count_sorted(values):
+    """
+    Count occurrences of each value, most frequent first
+    
+    Args:
+        values: numpy object array of labels
+    
+    Returns:
+        List of (label, count) pairs
+    """
+    # The vocabularies are tiny, so factorize to integer codes (hash-based, no
+    # object sort) and bincount; sort=True keeps ties ordered alphabetically.
+    # pandas is imported here rather than at module load
+    import pandas as pd
+    codes, labels = pd.factorize(values, sort=True)
+    counts = np.bincount(codes, minlength=len(labels))
+    labels = np.asarray(labels, dtype=object)
+    order = np.argsort(-counts, kind="stable")
+    return list(zip(labels[order].tolist(), counts[order].tolist()))
+
+def count_fib_levels(fib_levels):
+    """
+    Count trades per Fibonacci level
+    
+    Standard levels are binned against FIB_EDGES by the compiled histogram;
+    any other numeric level is counted separately
+    
+    Args:
+        fib_levels: numpy object array of level labels ("Unknown" is skipped)
+    
+    Returns:
+        Dictionary of level label -> count
+    """
+    numeric = []
+    for level in fib_levels:
+        if level == "Unknown":
+            continue
+        try:
+            numeric.append(float(level))
+        except ValueError:
+            continue
+    if not numeric:
+        return {}
+    
+    levels_f = np.array(numeric, dtype=np.float64)
+    counts, off_grid = _fib_hist(levels_f, FIB_EDGES)
+    fib_level_counts = {f"{edge:g}": int(count) for edge, count in zip(FIB_EDGES, counts) if count}
+    if off_grid.any():
+        extra, extra_counts = np.unique(levels_f[off_grid], return_counts=True)
+        for level, count in zip(extra, extra_counts):
+            fib_level_counts[f"{level:g}"] = int(count)
+    return fib_level_counts
+
+# Trade fields read by compute_stats, with the value used when one is missing
+TRADE_DEFAULTS = {
+    "timestamp": "",
+    "symbol": "Unknown",
+    "side": "Unknown",
+    "fib_level": "Unknown",
+    "action": "trade",
+    "success": False
+}
+_trade_fields = itemgetter(*TRADE_DEFAULTS)
+
+def compute_stats(trades):
+    """
+    Aggregate trades into the data behind each chart
+    
+    Args:
+        trades: List of trade dictionaries from the trade history file
+    
+    Returns:
+        JSON-serializable dictionary with per-symbol, side, action and Fibonacci
+        level counts, success/failure totals and the trade timeline
+    """
+    # Extract every field with one itemgetter call per trade, then transpose
+    n = len(trades)
+    rows = [_trade_fields({**TRADE_DEFAULTS, **trade}) for trade in trades]
+    raw_timestamps, symbols, sides, fib_levels, actions, successes = (
+        zip(*rows) if rows else ((),) * len(TRADE_DEFAULTS)
+    )
+    symbols = np.array(list(map(str, symbols)), dtype=object)
+    sides = np.array(list(map(str, sides)), dtype=object)
+    fib_levels = np.array(list(map(str, fib_levels)), dtype=object)
+    actions = np.array(list(map(str, actions)), dtype=object)
+    timestamps = parse_timestamps(list(raw_timestamps)) if n else np.array([], dtype="datetime64[ns]")
+    successes = np.fromiter(map(bool, successes), dtype=bool, count=n)
+    
+    # Count trades by Fibonacci level, ordered by level
+    fib_level_counts = count_fib_levels(fib_levels)
+    fib_levels_sorted = sorted(fib_level_counts.items(), key=lambda x: float(x[0]) if x[0] != "Unknown" else 0)
+    
+    # Count successful trades
+    success_count = int(successes.sum())
+    
+    return {
+        "total_trades": n,
+        "symbols": count_sorted(symbols),
+        "sides": count_sorted(sides),
+        "actions": count_sorted(actions),
+        "fib_levels": fib_levels_sorted,
+        "success_count": success_count,
+        "fail_count": n - success_count,
+        "timeline": np.datetime_as_string(timestamps, unit="s").tolist()
+    }
+
+def render_matplotlib(stats, output_file=None):
+    """
+    Draw the six strategy charts for stats produced by compute_stats
+    
+    Args:
+        stats: Dictionary returned by compute_stats
+        output_file: Path to save the figure to. When omitted, the figure is shown
+            interactively, or returned as PNG bytes under a non-interactive backend
+    
+    Returns:
+        PNG bytes when no output file was given under a non-interactive backend
+    """
+    matplotlib, plt = _pyplot()
+    symbols_sorted = stats["symbols"]
+    sides_sorted = stats["sides"]
+    actions_sorted = stats["actions"]
+    fib_levels_sorted = stats["fib_levels"]
+    timestamps = np.array(stats["timeline"], dtype="datetime64[s]")
+    
+    # Create figure with all six subplots at once; constrained layout replaces tight_layout
+    fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(2, 3, figsize=(15, 10), constrained_layout=True)
+    try:
+        fig.suptitle("Fibonacci Strategy Visualization", fontsize=16)
+    
+        # Plot 1: Trades by Symbol
+        ax1.bar([x[0] for x in symbols_sorted], [x[1] for x in symbols_sorted])
+        ax1.set_title("Trades by Symbol")
+        ax1.set_xlabel("Symbol")
+        ax1.set_ylabel("Count")
+        ax1.tick_params(axis="x", labelrotation=45)
+    
+        # Plot 2: Trades by Side
+        ax2.bar([x[0] for x in sides_sorted], [x[1] for x in sides_sorted], color=['green' if x[0].lower() == 'buy' else 'red' for x in sides_sorted])
+        ax2.set_title("Trades by Side")
+        ax2.set_xlabel("Side")
+        ax2.set_ylabel("Count")
+    
+        # Plot 3: Trades by Action
+        ax3.bar([x[0] for x in actions_sorted], [x[1] for x in actions_sorted])
+        ax3.set_title("Trades by Action")
+        ax3.set_xlabel("Action")
+        ax3.set_ylabel("Count")
+    
+        # Plot 4: Trades by Fibonacci Level
+        if fib_levels_sorted:
+            ax4.bar([x[0] for x in fib_levels_sorted], [x[1] for x in fib_levels_sorted])
+            ax4.set_title("Trades by Fibonacci Level")
+            ax4.set_xlabel("Fibonacci Level")
+            ax4.set_ylabel("Count")
+        else:
+            ax4.text(0.5, 0.5, "No Fibonacci Level Data", horizontalalignment='center', verticalalignment='center')
+            ax4.set_title("Trades by Fibonacci Level")
+    
+        # Plot 5: Success vs Failure
+        ax5.pie([stats["success_count"], stats["fail_count"]], labels=["Success", "Failure"], autopct='%1.1f%%', colors=['green', 'red'])
+        ax5.set_title("Trade Success Rate")
+    
+        # Plot 6: Trades Over Time
+        if len(timestamps):
+            # Create a timeline of trades
+            ax6.plot(timestamps, range(len(timestamps)), marker='o')
+            ax6.set_title("Trades Over Time")
+            ax6.set_xlabel("Time")
+            ax6.set_ylabel("Cumulative Trades")
+            ax6.tick_params(axis="x", labelrotation=45)
+        else:
+            ax6.text(0.5, 0.5, "No Timestamp Data", horizontalalignment='center', verticalalignment='center')
+            ax6.set_title("Trades Over Time")
+    
+        # Save or show the figure
+        if output_file:
+            fig.savefig(output_file)
+            print(f"📄 Visualization saved to: {output_file}")
+        elif not matplotlib.is_interactive() and matplotlib.get_backend().lower() in ("agg", "module://mplcairo.base"):
+            buffer = BytesIO()
+            fig.savefig(buffer, format="png")
+            return buffer.getvalue()
+        else:
+            plt.show()
+    finally:
+        # Free the figure so repeated calls don't accumulate figures in pyplot
+        plt.close(fig)
+        _collect_garbage()
+
+# Worker processes for render_async; each renders one figure and exits so
+# matplotlib memory never builds up in the calling process
+RENDER_WORKERS = 2
+
+@functools.lru_cache(maxsize=1)
+def _render_pool():
+    """
+    Create the render process pool on first use
+    
+    Workers are long-lived, so the caller's module is imported once per worker
+    rather than once per render. They are started with forkserver (spawn where
+    that is unavailable), never by forking the threaded web server
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=RENDER_WORKERS, mp_context=multiprocessing.get_context(start_method))
+
+def render_async(stats, output_file=None):
+    """
+    Render stats with render_matplotlib in a worker process
+    
+    Args:
+        stats: Dictionary returned by compute_stats
+        output_file: Path to save the figure to; PNG bytes are returned when omitted
+    
+    Returns:
+        concurrent.futures.Future resolving to render_matplotlib's result
+    """
+    return _render_pool().submit(render_matplotlib, stats, output_file)
+
 def visualize_fibonacci_strategy(history_file="logs/fibonacci_trades.json", output_file=None):
     """
     Visualize the Fibonacci strategy results
+    
+    Args:
+        history_file: Path to the trade history file
+        output_file: Path to save the figure to. When omitted, the figure is shown
+            interactively, or returned as PNG bytes under a non-interactive backend
+    
+    Returns:
+        PNG bytes when no output file was given under a non-interactive backend
     """
     # Load trade history
     trades = load_trade_history(history_file)
@@ -51,119 +415,7 @@ def visualize_fibonacci_strategy(history_file="logs/fibonacci_trades.json", outp
     print(f"📁 Trade history file: {history_file}")
     print(f"📈 Total trades: {len(trades)}")
     
-    # Extract data
-    timestamps = [parse_timestamp(trade.get("timestamp", "")) for trade in trades]
-    symbols = [trade.get("symbol", "Unknown") for trade in trades]
-    sides = [trade.get("side", "Unknown") for trade in trades]
-    fib_levels = [trade.get("fib_level", "Unknown") for trade in trades]
-    actions = [trade.get("action", "trade") for trade in trades]
-    successes = [trade.get("success", False) for trade in trades]
-    
-    # Count trades by symbol
-    symbol_counts = {}
-    for symbol in symbols:
-        if symbol in symbol_counts:
-            symbol_counts[symbol] += 1
-        else:
-            symbol_counts[symbol] = 1
-    
-    # Count trades by side
-    side_counts = {}
-    for side in sides:
-        if side in side_counts:
-            side_counts[side] += 1
-        else:
-            side_counts[side] = 1
-    
-    # Count trades by action
-    action_counts = {}
-    for action in actions:
-        if action in action_counts:
-            action_counts[action] += 1
-        else:
-            action_counts[action] = 1
-    
-    # Count trades by Fibonacci level
-    fib_level_counts = {}
-    for level in fib_levels:
-        if level != "Unknown":
-            if level in fib_level_counts:
-                fib_level_counts[level] += 1
-            else:
-                fib_level_counts[level] = 1
-    
-    # Count successful trades
-    success_count = sum(successes)
-    fail_count = len(successes) - success_count
-    
-    # Create figure with subplots
-    fig = plt.figure(figsize=(15, 10))
-    fig.suptitle("Fibonacci Strategy Visualization", fontsize=16)
-    
-    # Plot 1: Trades by Symbol
-    ax1 = plt.subplot(2, 3, 1)
-    symbols_sorted = sorted(symbol_counts.items(), key=lambda x: x[1], reverse=True)
-    ax1.bar([x[0] for x in symbols_sorted], [x[1] for x in symbols_sorted])
-    ax1.set_title("Trades by Symbol")
-    ax1.set_xlabel("Symbol")
-    ax1.set_ylabel("Count")
-    plt.xticks(rotation=45)
-    
-    # Plot 2: Trades by Side
-    ax2 = plt.subplot(2, 3, 2)
-    sides_sorted = sorted(side_counts.items(), key=lambda x: x[1], reverse=True)
-    ax2.bar([x[0] for x in sides_sorted], [x[1] for x in sides_sorted], color=['green' if x[0].lower() == 'buy' else 'red' for x in sides_sorted])
-    ax2.set_title("Trades by Side")
-    ax2.set_xlabel("Side")
-    ax2.set_ylabel("Count")
-    
-    # Plot 3: Trades by Action
-    ax3 = plt.subplot(2, 3, 3)
-    actions_sorted = sorted(action_counts.items(), key=lambda x: x[1], reverse=True)
-    ax3.bar([x[0] for x in actions_sorted], [x[1] for x in actions_sorted])
-    ax3.set_title("Trades by Action")
-    ax3.set_xlabel("Action")
-    ax3.set_ylabel("Count")
-    
-    # Plot 4: Trades by Fibonacci Level
-    ax4 = plt.subplot(2, 3, 4)
-    if fib_level_counts:
-        fib_levels_sorted = sorted(fib_level_counts.items(), key=lambda x: float(x[0]) if x[0] != "Unknown" else 0)
-        ax4.bar([x[0] for x in fib_levels_sorted], [x[1] for x in fib_levels_sorted])
-        ax4.set_title("Trades by Fibonacci Level")
-        ax4.set_xlabel("Fibonacci Level")
-        ax4.set_ylabel("Count")
-    else:
-        ax4.text(0.5, 0.5, "No Fibonacci Level Data", horizontalalignment='center', verticalalignment='center')
-        ax4.set_title("Trades by Fibonacci Level")
-    
-    # Plot 5: Success vs Failure
-    ax5 = plt.subplot(2, 3, 5)
-    ax5.pie([success_count, fail_count], labels=["Success", "Failure"], autopct='%1.1f%%', colors=['green', 'red'])
-    ax5.set_title("Trade Success Rate")
-    
-    # Plot 6: Trades Over Time
-    ax6 = plt.subplot(2, 3, 6)
-    if timestamps:
-        # Create a timeline of trades
-        ax6.plot(timestamps, range(len(timestamps)), marker='o')
-        ax6.set_title("Trades Over Time")
-        ax6.set_xlabel("Time")
-        ax6.set_ylabel("Cumulative Trades")
-        plt.xticks(rotation=45)
-    else:
-        ax6.text(0.5, 0.5, "No Timestamp Data", horizontalalignment='center', verticalalignment='center')
-        ax6.set_title("Trades Over Time")
-    
-    # Adjust layout
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
-    
-    # Save or show the figure
-    if output_file:
-        plt.savefig(output_file)
-        print(f"📄 Visualization saved to: {output_file}")
-    else:
-        plt.show()
+    return render_matplotlib(compute_stats(trades), output_file)
 
 def main():
     # Parse command line arguments
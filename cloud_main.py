@@ -3,15 +3,34 @@ import sys
 import json
 import logging
 import datetime
-from flask import Flask, request, jsonify
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+# orjson parses/serializes much faster than the stdlib; fall back to json without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the root directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the CloudTradeExecutor
-from cloud_trade_executor import CloudTradeExecutor
+from cloud_trade_executor import CloudTradeExecutor, read_status, STATUS_LOG_FILE
+
+# Chart data for /api/visualize; numpy and pandas may be missing in slim deployments
+try:
+    from backend.visualize_fibonacci_strategy import compute_stats, render_async, warm_up
+    VISUALIZE_AVAILABLE = True
+except ImportError:
+    VISUALIZE_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
@@ -36,85 +55,354 @@ app = Flask(__name__)
 cors_origins = os.getenv('CORS_ORIGINS', '*')
 CORS(app, resources={r"/*": {"origins": cors_origins.split(',') if ',' in cors_origins else cors_origins}})
 
-# Store active sessions
-active_sessions = {}
+# JIT-compile the chart histogram at boot rather than on the first request
+if VISUALIZE_AVAILABLE:
+    warm_up()
+
+# Settings that do not change during the process lifetime
+HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
+ENV_LABEL = "cloud" if HEADLESS else "local"
+DEFAULT_ACCOUNT_ID = os.getenv('BULENOX_ACCOUNT_ID', 'BX64883')
+
+# Store active sessions; Flask serves requests on several threads, so every
+# access goes through _sessions_lock. Each session holds a browser, so the
+# registry is an LRU: beyond MAX_SESSIONS the least recently used session is
+# closed, and sessions idle for SESSION_IDLE_SECONDS are closed by a reaper
+MAX_SESSIONS = int(os.getenv('MAX_SESSIONS', 8))
+SESSION_IDLE_SECONDS = int(os.getenv('SESSION_IDLE_SECONDS', 1800))
+REAP_INTERVAL_SECONDS = 60
+
+active_sessions = OrderedDict()
+# session_id -> [created_at label, time.monotonic() of last use]
+_session_times = {}
+# session_id -> [Lock serializing use of that session's browser, number of
+# requests holding or waiting for it]; an entry is dropped only when that count
+# is zero, so two requests for one session always share the same lock
+_session_locks = {}
+_sessions_lock = threading.RLock()
+_sessions_summary_cache = None
+_reaper_started = False
+
+def _close_executors(executors):
+    """
+    Close evicted executors, outside the registry lock
+    """
+    for executor in executors:
+        try:
+            executor.close()
+        except Exception as e:
+            logger.error(f"Error closing session for account {executor.account_id}: {e}")
+
+def get_or_create_session(session_id, account_id):
+    """
+    Return (executor, created) for a session, creating the executor if it is new
+    """
+    global _sessions_summary_cache
+    evicted = []
+    with _sessions_lock:
+        executor = active_sessions.get(session_id)
+        if executor is not None:
+            active_sessions.move_to_end(session_id)
+            _session_times[session_id][1] = time.monotonic()
+            return executor, False
+        executor = CloudTradeExecutor(account_id=account_id, session_id=session_id)
+        active_sessions[session_id] = executor
+        _session_times[session_id] = [datetime.datetime.now().strftime('%Y%m%d-%H%M%S'), time.monotonic()]
+        # Evict from the least recently used end, skipping sessions in use
+        for old_id in list(active_sessions):
+            if len(active_sessions) <= MAX_SESSIONS:
+                break
+            if old_id == session_id or _session_in_use(old_id):
+                continue
+            logger.info(f"Evicting least recently used session {old_id}")
+            evicted.append(active_sessions.pop(old_id))
+            _session_times.pop(old_id, None)
+            _session_locks.pop(old_id, None)
+        _sessions_summary_cache = None
+        _start_session_reaper()
+    _close_executors(evicted)
+    return executor, True
+
+def remove_session(session_id):
+    """
+    Forget a session and return its executor (None if it was not active)
+    """
+    global _sessions_summary_cache
+    with _sessions_lock:
+        executor = active_sessions.pop(session_id, None)
+        _session_times.pop(session_id, None)
+        # A request holding the lock drops the entry itself when it is done
+        if not _session_in_use(session_id):
+            _session_locks.pop(session_id, None)
+        if executor is not None:
+            _sessions_summary_cache = None
+        return executor
+
+def _session_in_use(session_id):
+    """
+    Whether a request holds or is waiting for the session's lock (call with _sessions_lock held)
+    """
+    entry = _session_locks.get(session_id)
+    return entry is not None and entry[1] > 0
+
+@contextmanager
+def session_lock(session_id):
+    """
+    Hold the session's lock while driving its browser
+    """
+    with _sessions_lock:
+        entry = _session_locks.setdefault(session_id, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _sessions_lock:
+            entry[1] -= 1
+            if entry[1] == 0 and session_id not in active_sessions:
+                _session_locks.pop(session_id, None)
+
+def reap_idle_sessions():
+    """
+    Close sessions unused for more than SESSION_IDLE_SECONDS
+    """
+    global _sessions_summary_cache
+    cutoff = time.monotonic() - SESSION_IDLE_SECONDS
+    evicted = []
+    with _sessions_lock:
+        for session_id in [sid for sid, times in _session_times.items() if times[1] < cutoff]:
+            # Skip sessions in the middle of a trade; they are no longer idle
+            if _session_in_use(session_id):
+                continue
+            logger.info(f"Closing idle session {session_id}")
+            evicted.append(active_sessions.pop(session_id))
+            _session_times.pop(session_id, None)
+            _session_locks.pop(session_id, None)
+        if evicted:
+            _sessions_summary_cache = None
+    _close_executors(evicted)
+
+def _reap_periodically():
+    """
+    Timer callback: reap idle sessions, then schedule the next run
+    """
+    try:
+        reap_idle_sessions()
+        CloudTradeExecutor.close_idle()
+    except Exception as e:
+        logger.error(f"Error reaping idle sessions: {e}")
+    timer = threading.Timer(REAP_INTERVAL_SECONDS, _reap_periodically)
+    timer.daemon = True
+    timer.start()
+
+def _start_session_reaper():
+    """
+    Start the idle-session reaper once, when the first session is created
+    """
+    global _reaper_started
+    if not _reaper_started:
+        _reaper_started = True
+        timer = threading.Timer(REAP_INTERVAL_SECONDS, _reap_periodically)
+        timer.daemon = True
+        timer.start()
+
+def session_summaries():
+    """
+    Summary of active sessions, rebuilt only after sessions change
+    """
+    global _sessions_summary_cache
+    with _sessions_lock:
+        if _sessions_summary_cache is None:
+            _sessions_summary_cache = [{
+                "session_id": session_id,
+                "account_id": executor.account_id,
+                "created_at": _session_times[session_id][0]
+            } for session_id, executor in active_sessions.items()]
+        return _sessions_summary_cache
+
+def read_json_file(path):
+    """
+    Read and parse a JSON file, using orjson when available
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Parsed JSON files keyed by path, holding (st_mtime_ns, st_size, data)
+_json_file_cache = {}
+
+def read_json_file_cached(path, loader=read_json_file):
+    """
+    Read a JSON file, re-parsing it only when its mtime or size has changed.
+    Callers get a shallow copy so they can add keys without touching the cache
+    
+    Args:
+        path: File to read
+        loader: Function parsing the file at path; read_json_file by default
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_file_cache.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, loader(path))
+        _json_file_cache[path] = cached
+    data = cached[1]
+    return dict(data) if isinstance(data, dict) else data
+
+def write_json_file(path, data):
+    """
+    Write data to a JSON file with 2-space indentation, using orjson when available.
+    The file is written to a temporary path and swapped in with os.replace, so a
+    crash mid-write never leaves a truncated file behind
+    """
+    # One temporary file per thread, so concurrent writers don't share it
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+    os.replace(tmp_path, path)
+    
+    # Prime the read cache so the next read of this file skips the parse
+    st = os.stat(path)
+    _json_file_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+
+def tail_lines(path, n, block_size=8192):
+    """
+    Return the last n lines of a file, reading backwards in blocks so only the
+    tail is read no matter how large the file is
+    """
+    if n <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        while position > 0 and data.count(b'\n') <= n:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    return [line.decode('utf-8', errors='replace').strip() for line in data.splitlines()[-n:]]
+
+def dumps_bytes(data):
+    """
+    Serialize data to compact JSON bytes, using orjson when available
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def stream_json_lines(header, lines, batch_size=500):
+    """
+    Yield a JSON object made of header's fields plus a "lines" array, in chunks
+    
+    Args:
+        header: Dictionary of the other response fields
+        lines: List of strings for the "lines" array
+        batch_size: Number of lines encoded per chunk
+    """
+    yield dumps_bytes(header)[:-1] + b',"lines":['
+    for start in range(0, len(lines), batch_size):
+        chunk = b','.join(dumps_bytes(line) for line in lines[start:start + batch_size])
+        yield chunk if start == 0 else b',' + chunk
+    yield b']}'
+
+def json_response(data, status=200):
+    """
+    Serialize data straight to a JSON response with orjson, falling back to jsonify
+    """
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(data), mimetype='application/json'), status
+    return jsonify(data), status
+
+# The root payload never changes, so it is serialized once
+ROOT_INFO = {
+    "status": "ok",
+    "message": "AI Trading Sentinel Cloud API",
+    "version": "0.3.0-cloud",
+    "endpoints": [
+        "/api/health",
+        "/api/login",
+        "/api/trade",
+        "/api/sessions",
+        "/api/status",
+        "/api/strategy",
+        "/api/logs",
+        "/api/visualize",
+        "/api/heartbeat/status"
+    ]
+}
+ROOT_BODY = orjson.dumps(ROOT_INFO) if ORJSON_AVAILABLE else None
 
 # Root route
 @app.route("/", methods=["GET"])
 def root():
-    return jsonify({
-        "status": "ok",
-        "message": "AI Trading Sentinel Cloud API",
-        "version": "0.3.0-cloud",
-        "endpoints": [
-            "/api/health",
-            "/api/login",
-            "/api/trade",
-            "/api/sessions",
-            "/api/status",
-            "/api/strategy",
-            "/api/logs",
-            "/api/heartbeat/status"
-        ]
-    }), 200
+    if ROOT_BODY is not None:
+        return Response(ROOT_BODY, mimetype='application/json'), 200
+    return jsonify(ROOT_INFO), 200
 
 # Health check
 @app.route("/api/health", methods=["GET"])
 def health():
-    return jsonify({
-        "status": "ok", 
+    # A fresh dict per call keeps concurrent probes from sharing state
+    return json_response({
+        "status": "ok",
         "timestamp": datetime.datetime.now().isoformat(),
-        "active_sessions": len(active_sessions),
-        "environment": "cloud" if os.getenv('HEADLESS', 'true').lower() == 'true' else "local"
-    }), 200
+        "active_sessions": len(session_summaries()),
+        "environment": ENV_LABEL
+    })
 
 # Login route
 @app.route("/api/login", methods=["POST"])
 def login():
     try:
         data = request.get_json()
-        account_id = data.get("account_id", os.getenv('BULENOX_ACCOUNT_ID', 'BX64883'))
+        account_id = data.get("account_id", DEFAULT_ACCOUNT_ID)
         session_id = data.get("session_id")
         
         # Generate session ID if not provided
         if not session_id:
             session_id = f"{account_id}-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}"
         
-        # Check if session already exists
-        if session_id in active_sessions:
-            logger.info(f"Session {session_id} already exists, reusing")
-            executor = active_sessions[session_id]
-        else:
-            # Create new executor
-            logger.info(f"Creating new session {session_id} for account {account_id}")
-            executor = CloudTradeExecutor(account_id=account_id, session_id=session_id)
-            active_sessions[session_id] = executor
-        
-        # Set API_MODE environment variable to prevent input prompt
-        os.environ['API_MODE'] = 'true'
-        
-        # Perform login
-        executor.login()
-        
-        if executor.driver:
-            logger.info(f"Login successful for session {session_id}")
-            return jsonify({
-                "status": "success",
-                "message": "Login successful",
-                "session_id": session_id,
-                "account_id": account_id
-            }), 200
-        else:
-            logger.error(f"Login failed for session {session_id}")
-            # Clean up failed session
-            if session_id in active_sessions:
-                executor.close()
-                del active_sessions[session_id]
+        # Hold the session lock so eviction and the idle reaper can't close the browser mid-login
+        with session_lock(session_id):
+            # Reuse the session if it already exists, otherwise create it
+            executor, created = get_or_create_session(session_id, account_id)
+            if created:
+                logger.info(f"Created new session {session_id} for account {account_id}")
+            else:
+                logger.info(f"Session {session_id} already exists, reusing")
             
-            return jsonify({
-                "status": "error",
-                "message": "Login failed"
-            }), 401
+            # Set API_MODE environment variable to prevent input prompt
+            os.environ['API_MODE'] = 'true'
+            
+            # Perform login
+            executor.login()
+            
+            if executor.driver:
+                logger.info(f"Login successful for session {session_id}")
+                return jsonify({
+                    "status": "success",
+                    "message": "Login successful",
+                    "session_id": session_id,
+                    "account_id": account_id
+                }), 200
+            else:
+                logger.error(f"Login failed for session {session_id}")
+                # Clean up failed session
+                if remove_session(session_id) is not None:
+                    executor.close()
+                
+                return jsonify({
+                    "status": "error",
+                    "message": "Login failed"
+                }), 401
     
     except Exception as e:
         logger.exception(f"Error during login: {e}")
@@ -128,7 +416,7 @@ def login():
 def execute_trade():
     try:
         data = request.get_json()
-        account_id = data.get("account_id", os.getenv('BULENOX_ACCOUNT_ID', 'BX64883'))
+        account_id = data.get("account_id", DEFAULT_ACCOUNT_ID)
         session_id = data.get("session_id")
         signal = data.get("signal", {})
         
@@ -156,47 +444,46 @@ def execute_trade():
         if not session_id:
             session_id = f"{account_id}-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}"
         
-        # Check if session exists
-        if session_id in active_sessions:
-            logger.info(f"Using existing session {session_id}")
-            executor = active_sessions[session_id]
-        else:
-            # Create new executor and login
-            logger.info(f"Creating new session {session_id} for account {account_id}")
-            executor = CloudTradeExecutor(account_id=account_id, session_id=session_id)
-            active_sessions[session_id] = executor
-            
-            executor.login()
-            if not executor.driver:
-                logger.error(f"Login failed for new session {session_id}")
-                # Clean up failed session
-                executor.close()
-                del active_sessions[session_id]
+        # Hold the session lock so eviction and the idle reaper can't close the browser mid-trade
+        with session_lock(session_id):
+            # Use the existing session, or create one and login
+            executor, created = get_or_create_session(session_id, account_id)
+            if not created:
+                logger.info(f"Using existing session {session_id}")
+            else:
+                logger.info(f"Created new session {session_id} for account {account_id}")
                 
+                executor.login()
+                if not executor.driver:
+                    logger.error(f"Login failed for new session {session_id}")
+                    # Clean up failed session
+                    executor.close()
+                    remove_session(session_id)
+                    
+                    return jsonify({
+                        "status": "error",
+                        "message": "Login failed, cannot execute trade"
+                    }), 401
+            
+            # Execute trade
+            logger.info(f"Executing trade for session {session_id}: {signal}")
+            success = executor.execute_trade(signal)
+            
+            if success:
+                logger.info(f"Trade executed successfully for session {session_id}")
+                return jsonify({
+                    "status": "success",
+                    "message": "Trade executed successfully",
+                    "session_id": session_id,
+                    "account_id": account_id,
+                    "signal": signal
+                }), 200
+            else:
+                logger.error(f"Trade execution failed for session {session_id}")
                 return jsonify({
                     "status": "error",
-                    "message": "Login failed, cannot execute trade"
-                }), 401
-        
-        # Execute trade
-        logger.info(f"Executing trade for session {session_id}: {signal}")
-        success = executor.execute_trade(signal)
-        
-        if success:
-            logger.info(f"Trade executed successfully for session {session_id}")
-            return jsonify({
-                "status": "success",
-                "message": "Trade executed successfully",
-                "session_id": session_id,
-                "account_id": account_id,
-                "signal": signal
-            }), 200
-        else:
-            logger.error(f"Trade execution failed for session {session_id}")
-            return jsonify({
-                "status": "error",
-                "message": "Trade execution failed"
-            }), 500
+                    "message": "Trade execution failed"
+                }), 500
     
     except Exception as e:
         logger.exception(f"Error during trade execution: {e}")
@@ -208,13 +495,7 @@ def execute_trade():
 # List active sessions
 @app.route("/api/sessions", methods=["GET"])
 def list_sessions():
-    sessions = []
-    for session_id, executor in active_sessions.items():
-        sessions.append({
-            "session_id": session_id,
-            "account_id": executor.account_id,
-            "created_at": session_id.split("-")[-2] + "-" + session_id.split("-")[-1] if "-" in session_id else "unknown"
-        })
+    sessions = session_summaries()
     
     return jsonify({
         "status": "success",
@@ -225,26 +506,22 @@ def list_sessions():
 # Get status information
 @app.route("/api/status", methods=["GET"])
 def get_status():
-    # Read status.json if it exists
-    status_file = os.path.join(log_dir, "status.json")
+    # Read the trade status log if it exists
     status_data = {"trades": [], "last_update": None}
     
-    if os.path.exists(status_file):
+    if os.path.exists(STATUS_LOG_FILE):
         try:
-            with open(status_file, 'r') as f:
-                status_data = json.load(f)
+            status_data = read_json_file_cached(STATUS_LOG_FILE, loader=read_status)
         except Exception as e:
             logger.error(f"Error reading status file: {e}")
     
     # Add active sessions info
-    status_data["active_sessions"] = len(active_sessions)
-    status_data["sessions"] = []
-    
-    for session_id, executor in active_sessions.items():
-        status_data["sessions"].append({
-            "session_id": session_id,
-            "account_id": executor.account_id
-        })
+    sessions = session_summaries()
+    status_data["active_sessions"] = len(sessions)
+    status_data["sessions"] = [{
+        "session_id": session["session_id"],
+        "account_id": session["account_id"]
+    } for session in sessions]
     
     return jsonify(status_data), 200
 
@@ -277,22 +554,18 @@ def get_logs():
                 "message": f"Log file not found: {os.path.basename(log_file)}"
             }), 404
         
-        # Read the last N lines from the log file
-        with open(log_file, 'r') as f:
-            # Use a deque with maxlen to efficiently get the last N lines
-            from collections import deque
-            last_lines = deque(maxlen=lines)
-            for line in f:
-                last_lines.append(line.strip())
+        # Read only the tail of the log file
+        last_lines = tail_lines(log_file, lines)
         
-        return jsonify({
+        # Stream the body so large tails are never held as one JSON string
+        header = {
             "status": "success",
             "log_type": log_type,
             "session_id": session_id,
             "filename": os.path.basename(log_file),
-            "lines": list(last_lines),
             "timestamp": datetime.datetime.now().isoformat()
-        }), 200
+        }
+        return Response(stream_json_lines(header, last_lines), mimetype='application/json'), 200
         
     except Exception as e:
         logger.exception(f"Error retrieving logs: {e}")
@@ -309,8 +582,7 @@ def manage_strategy():
         strategy_file = os.path.join(log_dir, "strategy.json")
         if os.path.exists(strategy_file):
             try:
-                with open(strategy_file, 'r') as f:
-                    strategy_data = json.load(f)
+                strategy_data = read_json_file_cached(strategy_file)
                 return jsonify(strategy_data), 200
             except Exception as e:
                 logger.error(f"Error reading strategy file: {e}")
@@ -342,8 +614,7 @@ def manage_strategy():
                 "updated_at": datetime.datetime.now().isoformat()
             }
             
-            with open(strategy_file, 'w') as f:
-                json.dump(strategy_data, f, indent=2)
+            write_json_file(strategy_file, strategy_data)
             
             logger.info(f"Strategy updated to {strategy_name} with parameters {parameters}")
             return jsonify(strategy_data), 200
@@ -352,6 +623,78 @@ def manage_strategy():
             logger.exception(f"Error updating strategy: {e}")
             return jsonify({"status": "error", "message": str(e)}), 500
 
+# Fibonacci strategy chart data; the client renders the charts
+@app.route("/api/visualize", methods=["GET"])
+def visualize():
+    if not VISUALIZE_AVAILABLE:
+        return jsonify({"status": "error", "message": "Visualization dependencies are not installed"}), 501
+    
+    history_file = os.path.join(log_dir, "fibonacci_trades.json")
+    if not os.path.exists(history_file):
+        return jsonify({"status": "error", "message": "No Fibonacci trade history found"}), 404
+    
+    try:
+        trades = read_json_file_cached(history_file)
+        return json_response({"status": "success", "stats": compute_stats(trades)})
+    except Exception as e:
+        logger.exception(f"Error computing visualization stats: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+# PNG render jobs submitted to the worker processes: job id -> (future, monotonic submit time).
+# Jobs nobody collects are dropped RENDER_JOB_TTL_SECONDS after submission
+render_jobs = {}
+_render_jobs_lock = threading.Lock()
+RENDER_JOB_TTL_SECONDS = int(os.getenv('RENDER_JOB_TTL_SECONDS', '600'))
+
+def _drop_expired_render_jobs():
+    """
+    Forget render jobs older than RENDER_JOB_TTL_SECONDS (call with _render_jobs_lock held)
+    """
+    cutoff = time.monotonic() - RENDER_JOB_TTL_SECONDS
+    for job_id in [jid for jid, (_, submitted) in render_jobs.items() if submitted < cutoff]:
+        future, _ = render_jobs.pop(job_id)
+        future.cancel()
+
+# Render the Fibonacci strategy charts to PNG off the request thread
+@app.route("/api/visualize/render", methods=["POST"])
+def start_render():
+    if not VISUALIZE_AVAILABLE:
+        return jsonify({"status": "error", "message": "Visualization dependencies are not installed"}), 501
+    
+    history_file = os.path.join(log_dir, "fibonacci_trades.json")
+    if not os.path.exists(history_file):
+        return jsonify({"status": "error", "message": "No Fibonacci trade history found"}), 404
+    
+    try:
+        stats = compute_stats(read_json_file_cached(history_file))
+        job_id = uuid.uuid4().hex
+        with _render_jobs_lock:
+            _drop_expired_render_jobs()
+            render_jobs[job_id] = (render_async(stats), time.monotonic())
+        return jsonify({"status": "accepted", "job_id": job_id}), 202
+    except Exception as e:
+        logger.exception(f"Error starting visualization render: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+# Poll a render job; returns the PNG once it is done
+@app.route("/api/visualize/<job_id>", methods=["GET"])
+def render_status(job_id):
+    with _render_jobs_lock:
+        job = render_jobs.get(job_id)
+        if job is None:
+            return jsonify({"status": "error", "message": "Unknown render job"}), 404
+        future = job[0]
+        if not future.done():
+            return jsonify({"status": "pending", "job_id": job_id}), 202
+        # Finished jobs are handed out once
+        del render_jobs[job_id]
+    
+    try:
+        return Response(future.result(), mimetype='image/png'), 200
+    except Exception as e:
+        logger.exception(f"Visualization render failed: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 500
+
 # Webhook endpoint for trade signals
 @app.route("/api/webhook", methods=["POST"])
 def webhook():
@@ -360,7 +703,7 @@ def webhook():
         logger.info(f"Received webhook: {data}")
         
         # Extract account_id and signal
-        account_id = data.get("account_id", os.getenv('BULENOX_ACCOUNT_ID', 'BX64883'))
+        account_id = data.get("account_id", DEFAULT_ACCOUNT_ID)
         signal = data.get("signal", {})
         
         # Validate signal
@@ -370,33 +713,28 @@ def webhook():
                 "message": "Invalid or missing signal data"
             }), 400
         
-        # Generate session ID
-        session_id = f"{account_id}-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        # One session per account, so repeat webhooks reuse the logged-in browser
+        session_id = f"{account_id}-webhook"
         
-        # Create new executor and login
-        logger.info(f"Creating new session {session_id} for account {account_id} from webhook")
-        executor = CloudTradeExecutor(account_id=account_id, session_id=session_id)
-        active_sessions[session_id] = executor
-        
-        executor.login()
-        if not executor.driver:
-            logger.error(f"Login failed for webhook session {session_id}")
-            # Clean up failed session
-            executor.close()
-            del active_sessions[session_id]
+        with session_lock(session_id):
+            executor, created = get_or_create_session(session_id, account_id)
+            if created or not executor.driver:
+                logger.info(f"Logging in webhook session {session_id} for account {account_id}")
+                executor.login()
+            if not executor.driver:
+                logger.error(f"Login failed for webhook session {session_id}")
+                # Clean up failed session
+                executor.close()
+                remove_session(session_id)
+                
+                return jsonify({
+                    "status": "error",
+                    "message": "Login failed, cannot execute trade"
+                }), 401
             
-            return jsonify({
-                "status": "error",
-                "message": "Login failed, cannot execute trade"
-            }), 401
-        
-        # Execute trade
-        logger.info(f"Executing trade for webhook session {session_id}: {signal}")
-        success = executor.execute_trade(signal)
-        
-        # Close session after webhook trade (don't keep it open)
-        executor.close()
-        del active_sessions[session_id]
+            # Execute trade; the session stays open for the next webhook
+            logger.info(f"Executing trade for webhook session {session_id}: {signal}")
+            success = executor.execute_trade(signal)
         
         if success:
             logger.info(f"Webhook trade executed successfully for session {session_id}")
@@ -491,7 +829,7 @@ if __name__ == "__main__":
     
     logger.info(f"Starting AI Trading Sentinel Cloud API on {host}:{port}")
     logger.info(f"Debug mode: {debug}")
-    logger.info(f"Environment: {'cloud' if os.getenv('HEADLESS', 'true').lower() == 'true' else 'local'}")
+    logger.info(f"Environment: {ENV_LABEL}")
     logger.info(f"CORS origins: {cors_origins}")
     
     app.run(host=host, port=port, debug=debug)
\ No newline at end of file
@@ -2,14 +2,30 @@ import os
 import time
 import json
 import random
+import atexit
+import collections
 import logging
+import logging.handlers
+import queue
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
 from dotenv import load_dotenv
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# orjson parses/serializes much faster than the stdlib; fall back to json without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the root directory to the Python path
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -28,15 +44,375 @@ logging.basicConfig(level=logging.INFO,
                         logging.StreamHandler()
                     ])
 
-logger = logging.getLogger("CLOUD_TRADE_EXECUTOR")
+# Shared by the per-session log handlers
+_LOG_FMT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+class _SessionFileRouter(logging.Handler):
+    """Write each session logger's records to that session's own log file"""
+    def __init__(self):
+        super().__init__()
+        # One FileHandler per log file, shared by every session logging to it
+        self._handlers = {}
+        self._routes = {}
+        self._handlers_lock = threading.Lock()
+    
+    def add_session(self, logger_name, log_file):
+        with self._handlers_lock:
+            file_handler = self._handlers.get(log_file)
+            if file_handler is None:
+                file_handler = logging.FileHandler(log_file)
+                file_handler.setFormatter(_LOG_FMT)
+                self._handlers[log_file] = file_handler
+            self._routes[logger_name] = file_handler
+    
+    def emit(self, record):
+        handler = self._routes.get(record.name)
+        if handler:
+            handler.handle(record)
+
+# Executor loggers only enqueue records; a listener thread does the file and
+# console writes, so trades never wait on log I/O
+_log_queue = queue.Queue(-1)
+_session_router = _SessionFileRouter()
+_executor_file_handler = logging.FileHandler(os.path.join(log_dir, "cloud_trade_executor.log"))
+_executor_file_handler.setFormatter(_LOG_FMT)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_LOG_FMT)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _executor_file_handler, _console_handler, _session_router, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _queue_logger(name):
+    """Logger whose records go only through the background listener"""
+    queued_logger = logging.getLogger(name)
+    if not queued_logger.handlers:
+        queued_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        queued_logger.propagate = False
+        queued_logger.setLevel(logging.INFO)
+    return queued_logger
+
+logger = _queue_logger("CLOUD_TRADE_EXECUTOR")
 
 # Load environment variables
 load_dotenv()
 
+# File locking for the profile history read-modify-write; fcntl on POSIX, msvcrt on Windows
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    try:
+        import msvcrt
+        MSVCRT_AVAILABLE = True
+    except ImportError:
+        MSVCRT_AVAILABLE = False
+
+@contextmanager
+def locked_file(path):
+    """Hold an exclusive lock on path + '.lock' so concurrent executors update path one at a time"""
+    with open(path + ".lock", 'a+') as lock_file:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        elif MSVCRT_AVAILABLE:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            elif MSVCRT_AVAILABLE:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def read_json(path):
+    """Parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def dumps_json_line(data):
+    """Serialize data as one compact JSON line (bytes, newline-terminated)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(',', ':')) + "\n").encode('utf-8')
+
+# Trade status log, one JSON object per line
+STATUS_LOG_FILE = os.path.join(log_dir, "status.jsonl")
+
+def read_status(path=STATUS_LOG_FILE):
+    """Read the trade status log
+    
+    Returns:
+        dict: {"trades": [...], "last_update": ISO time of the last write, or None}
+    """
+    trades = []
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    trades.append(orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line))
+                except ValueError:
+                    # Skip a line torn by a crash mid-append
+                    continue
+        last_update = datetime.datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+    except FileNotFoundError:
+        return {"trades": [], "last_update": None}
+    return {"trades": trades, "last_update": last_update}
+
+# Emotional feedback: the last FEEDBACK_HISTORY entries stay in memory for the UI,
+# and every entry is appended to emotional_feedback.jsonl by a background writer
+FEEDBACK_LOG_FILE = os.path.join(log_dir, "emotional_feedback.jsonl")
+FEEDBACK_HISTORY = 100
+FEEDBACK_FLUSH_SECONDS = 1.0
+# Once the log grows past this it is rotated to emotional_feedback.jsonl.1
+FEEDBACK_MAX_BYTES = 1024 * 1024
+
+_feedback_buf = collections.deque(maxlen=FEEDBACK_HISTORY)
+_feedback_queue = queue.Queue()
+# Entries are only taken off the queue under _feedback_write_lock; ones whose write
+# failed wait in _feedback_pending for the next attempt
+_feedback_pending = []
+_feedback_write_lock = threading.Lock()
+_feedback_ready = threading.Event()
+
+def _record_feedback(entry):
+    """Keep a feedback entry in memory and queue it for the background writer"""
+    _feedback_buf.append(entry)
+    _feedback_queue.put_nowait(entry)
+    _feedback_ready.set()
+
+def recent_feedback():
+    """Snapshot of the most recent emotional feedback entries, oldest first"""
+    return list(_feedback_buf)
+
+def _drain_feedback_queue():
+    """Move everything currently queued into _feedback_pending without blocking"""
+    while True:
+        try:
+            _feedback_pending.append(_feedback_queue.get_nowait())
+        except queue.Empty:
+            return
+
+def _write_pending_feedback():
+    """Append pending entries to the feedback log, rotating it when it gets too large (hold _feedback_write_lock)"""
+    _drain_feedback_queue()
+    if not _feedback_pending:
+        return
+    with open(FEEDBACK_LOG_FILE, 'ab', buffering=8192) as f:
+        for entry in _feedback_pending:
+            f.write(dumps_json_line(entry))
+        size = f.tell()
+    _feedback_pending.clear()
+    if size > FEEDBACK_MAX_BYTES:
+        os.replace(FEEDBACK_LOG_FILE, FEEDBACK_LOG_FILE + ".1")
+
+def _feedback_writer():
+    """Batch queued feedback entries and write them roughly once per FEEDBACK_FLUSH_SECONDS"""
+    while True:
+        _feedback_ready.wait()
+        time.sleep(FEEDBACK_FLUSH_SECONDS)
+        _feedback_ready.clear()
+        try:
+            with _feedback_write_lock:
+                _write_pending_feedback()
+        except Exception as e:
+            logger.error(f"Failed to save emotional feedback: {e}")
+
+def flush_feedback():
+    """Write any pending or queued feedback entries now"""
+    with _feedback_write_lock:
+        _write_pending_feedback()
+
+threading.Thread(target=_feedback_writer, name="feedback-writer", daemon=True).start()
+atexit.register(flush_feedback)
+
+def write_json_atomic(path, data):
+    """Write compact JSON to a temporary file and move it into place, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data, separators=(',', ':')).encode('utf-8'))
+    os.replace(tmp_path, path)
+
+# How long to look for the symbol search dropdown before pressing Enter; this
+# replaces a fixed 1s settle sleep plus a 5s wait
+DROPDOWN_WAIT_SECONDS = 1.5
+
+# Elements that show an order went through (success toast or new order row), and the
+# longest to wait for one after clicking; this is the old fixed settle time
+_TRADE_CONFIRM_SELECTORS = ('.toast-success', '[data-testid="order-row"]')
+TRADE_CONFIRM_WAIT_SECONDS = 2
+
+# URL patterns blocked by prepare_driver
+_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*hotjar*"
+)
+
+# Selectors and probes used by execute_trade, built once rather than per trade.
+# {bt} in the button templates is the BUY/SELL button text
+# Async script: arguments[0] is the timeout in ms; calls back true once the
+# trading UI is in the DOM, or false on timeout
+_WAIT_TRADING_UI_JS = """
+const done = arguments[arguments.length - 1];
+const ready = () => document.querySelector('.order-module, .trade-form, .trading-panel') !== null ||
+  Array.from(document.querySelectorAll('button')).some(b => b.textContent.includes('BUY'));
+if (ready()) { done(true); return; }
+const observer = new MutationObserver(() => {
+  if (ready()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(false); }, arguments[0]);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+_PAGE_PROBE_JS = """
+const text = (sel) => { const el = document.querySelector(sel); return el ? el.textContent : null; };
+const leafText = (needle) => {
+  const el = Array.from(document.querySelectorAll('body *')).find(e => !e.children.length && e.textContent.includes(needle));
+  return el ? el.textContent : null;
+};
+return {
+  balance: window.accountBalance || text('.account-balance, .balance, .account-value') || leafText('Balance:'),
+  signal: window.lastSignal || text('.last-signal, .signal, .trade-signal') || leafText('Signal:'),
+  orderModule: !!document.querySelector('.order-module, .trade-form, .trading-panel'),
+  timeSales: !!document.querySelector('.time-sales') || leafText('Time and Sales') !== null,
+  title: document.title,
+  url: location.href
+};
+"""
+_JS_SET_VALUE = """
+const el = arguments[0], value = arguments[1];
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+setter.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+# Scroll an element to the middle of the viewport and click it in one round trip
+_JS_SCROLL_CLICK = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+_SYMBOL_SELECTORS = (
+    "//input[@type='text' and @placeholder='Symbol']",
+    "//div[contains(@class, 'symbol-search')]//input",
+    "//input[contains(@class, 'symbol')]"
+)
+_QTY_SELECTORS = (
+    "//input[@type='number']",
+    "//input[contains(@placeholder, 'Qty') or contains(@placeholder, 'Quantity')]",
+    "//label[contains(text(), 'Quantity') or contains(text(), 'Qty')]/following::input"
+)
+_SL_SELECTORS = (
+    "//input[contains(@placeholder, 'Stop') or contains(@placeholder, 'SL')]",
+    "//label[contains(text(), 'Stop Loss')]/following::input",
+    "//div[contains(text(), 'Stop Loss')]/following::input"
+)
+_TP_SELECTORS = (
+    "//input[contains(@placeholder, 'Take Profit') or contains(@placeholder, 'TP')]",
+    "//label[contains(text(), 'Take Profit')]/following::input",
+    "//div[contains(text(), 'Take Profit')]/following::input"
+)
+# arguments[0] is the XPath counted for logging; arguments[1] the candidate XPaths
+# in priority order. Returns the first match as a WebElement with its index
+_FIND_BUTTON_JS = """
+const count = document.evaluate('count(' + arguments[0] + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue;
+const xpaths = arguments[1];
+for (let i = 0; i < xpaths.length; i++) {
+  const node = document.evaluate(xpaths[i], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  if (node) return {count: count, button: node, index: i};
+}
+return {count: count, button: null, index: -1};
+"""
+_BUTTON_COUNT_XPATH = "//button[contains(text(), '{bt}')]"
+_BUTTON_XPATHS = (
+    # Inside the left-side Order module
+    "(//div[contains(@class, 'order-module') or contains(@class, 'trade-form')]//button[contains(text(), '{bt}')])[1]",
+    # Near Order Type, Market, or input boxes
+    "//label[text()='Order Type']/../..//button[contains(text(), '{bt}')]",
+    "//label[text()='Market']/../..//button[contains(text(), '{bt}')]",
+    "//input[@type='number']/../..//button[contains(text(), '{bt}')]",
+    # First matching button on the page
+    "(//button[contains(text(), '{bt}')])[1]",
+    # Distinct button class or container proximity
+    "//button[contains(@class, 'buy-button') or contains(@class, 'sell-button')][contains(text(), '{bt}')]",
+    "//button[contains(@class, 'primary')][contains(text(), '{bt}')]",
+    "//div[contains(@class, 'trading-panel')]//button[contains(text(), '{bt}')]",
+    # Any button containing the text, including in child elements
+    "//button[contains(., '{bt}')]"
+)
+
+def _retry_with_backoff(fn, attempts=4, base=1.0, cap=30.0, budget=90.0):
+    """Call fn, retrying WebDriver errors and falsy results with jittered exponential backoff within a time budget
+    
+    Returns:
+        fn's first truthy result, or its last falsy one once attempts or budget run out
+    """
+    deadline = time.monotonic() + budget
+    for attempt in range(attempts):
+        try:
+            result = fn()
+            if result:
+                return result
+            reason = "no result"
+        except WebDriverException as e:
+            if attempt == attempts - 1:
+                raise
+            result, reason = None, e
+        delay = min(cap, base * (2 ** attempt)) * random.uniform(0.75, 1.25)
+        if attempt == attempts - 1 or time.monotonic() + delay > deadline:
+            if isinstance(reason, Exception):
+                raise reason
+            return result
+        logger.warning(f"Attempt {attempt + 1}/{attempts} failed, retrying in {delay:.1f}s: {reason}")
+        time.sleep(delay)
+
+# Logged-in drivers parked by close() are reused for this long before being quit
+POOL_IDLE_SECONDS = 600
+
+def _quit_driver(driver):
+    """Quit a driver, ignoring errors from browsers that already died"""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error quitting pooled driver: {e}")
+
+# Writes screenshot PNGs to disk off the trade thread
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=1)
+
+def _write_screenshot(filepath, png):
+    """Write captured PNG bytes to disk"""
+    try:
+        with open(filepath, 'wb') as f:
+            f.write(png)
+        logger.info(f"Screenshot saved to: {filepath}")
+    except Exception as e:
+        logger.error(f"Failed to save screenshot {filepath}: {e}")
+
 class CloudTradeExecutor:
+    # Futures symbol mapping, shared and read-only
+    futures_symbols = MappingProxyType({
+        "GBPUSD": "MBTQ25",  # British Pound futures
+        "EURUSD": "6EU25",   # Euro FX futures
+        "USDJPY": "6J25",    # Japanese Yen futures
+        "ES": "ES25"         # E-mini S&P 500 futures
+    })
+    
+    # Set once the screenshot directory has been created
+    _dirs_ready = False
+    
+    # Authenticated drivers shared across executors: account_id -> (driver, last_used)
+    _pool = {}
+    _pool_lock = threading.Lock()
+    
+    # Parsed profile login history shared by all executors, keyed on the file's mtime
+    _profile_history_cache = None
+    _profile_history_mtime = 0
+    
     def __init__(self, account_id=None, session_id=None):
         self.account_id = account_id or os.getenv('BULENOX_ACCOUNT_ID', 'BX64883')
-        self.session_id = session_id or f"{self.account_id}-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.session_id = session_id or f"{self.account_id}-{time.strftime('%Y%m%d-%H%M%S')}"
         
         # Configure session-specific logging
         self.setup_session_logging()
@@ -47,17 +423,23 @@ class CloudTradeExecutor:
         # Determine if we should take screenshots on failure
         self.screenshot_on_failure = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
         
-        # Set up screenshot directory
-        self.screenshot_dir = os.path.join(log_dir, "screenshots")
-        os.makedirs(self.screenshot_dir, exist_ok=True)
+        # Progress screenshots on the success path (login, page loaded, clicks) are opt-in
+        self.screenshot_on_success = os.getenv('SCREENSHOT_ON_SUCCESS', 'false').lower() == 'true'
         
-        # Futures symbol mapping
-        self.futures_symbols = {
-            "GBPUSD": "MBTQ25",  # British Pound futures
-            "EURUSD": "6EU25",   # Euro FX futures
-            "USDJPY": "6J25",    # Japanese Yen futures
-            "ES": "ES25"         # E-mini S&P 500 futures
-        }
+        # Block images, fonts and trackers the trade panel doesn't need
+        self.block_resources = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+        
+        # Type character by character with random delays (slow; for anti-bot checks only)
+        self.human_typing = os.getenv('HUMAN_TYPING', 'false').lower() == 'true'
+        
+        # BUY/SELL text -> index of the _BUTTON_XPATHS tier that last found that button
+        self._button_tiers = {}
+        
+        # Set up screenshot directory (created once per process)
+        self.screenshot_dir = os.path.join(log_dir, "screenshots")
+        if not CloudTradeExecutor._dirs_ready:
+            os.makedirs(self.screenshot_dir, exist_ok=True)
+            CloudTradeExecutor._dirs_ready = True
         
         self.driver = None
         self.logger.info(f"CloudTradeExecutor initialized for account {self.account_id} with session {self.session_id}")
@@ -65,28 +447,22 @@ class CloudTradeExecutor:
     
     def setup_session_logging(self):
         """Set up session-specific logging"""
-        self.logger = logging.getLogger(f"CLOUD_TRADE_EXECUTOR_{self.session_id}")
+        # A reconstructed executor for the same session reuses the configured logger
+        self.logger = _queue_logger(f"CLOUD_TRADE_EXECUTOR_{self.session_id}")
         session_log_file = os.path.join(log_dir, f"{self.account_id}-session.log")
-        
-        # Add a file handler for this session
-        file_handler = logging.FileHandler(session_log_file)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-        self.logger.addHandler(file_handler)
-        
-        # Ensure we also log to the console
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-        self.logger.addHandler(console_handler)
-        
-        self.logger.setLevel(logging.INFO)
+        _session_router.add_session(self.logger.name, session_log_file)
     
     def login(self):
         """Login to Bulenox using the profile with enhanced profile management"""
         try:
-            self.logger.info(f"Attempting to login to Bulenox for account {self.account_id}")
+            # Reuse an already authenticated browser for this account when one is parked
+            pooled_driver = self._checkout_driver(self.account_id)
+            if pooled_driver:
+                self.driver = pooled_driver
+                self.logger.info(f"Reusing pooled browser for account {self.account_id}")
+                return True
             
-            # Use temp profile in cloud/Docker environments
-            use_temp_profile = os.getenv('USE_TEMP_PROFILE', 'false').lower() == 'true'
+            self.logger.info(f"Attempting to login to Bulenox for account {self.account_id}")
             
             # Set API_MODE environment variable to prevent input prompt
             os.environ['API_MODE'] = 'true'
@@ -100,12 +476,12 @@ class CloudTradeExecutor:
             profile_failures = {}
             
             # Load profile failure history if it exists
-            if os.path.exists(profile_history_file):
-                try:
-                    with open(profile_history_file, 'r') as f:
-                        profile_failures = json.load(f)
-                except Exception as e:
-                    self.logger.warning(f"Could not load profile history: {e}")
+            try:
+                profile_failures = self._load_profile_history(profile_history_file)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"Could not load profile history: {e}")
             
             # Enhanced profile management - Check if preferred profile has failed too many times
             failure_count = profile_failures.get(preferred_profile, {}).get('failures', 0)
@@ -153,44 +529,25 @@ class CloudTradeExecutor:
             os.environ['BULENOX_PROFILE_NAME'] = preferred_profile
             self.logger.info(f"Using profile: {preferred_profile}")
             
-            # Call login function with parameters matching the root directory implementation
-            self.driver = login_bulenox_with_profile(
-                use_temp_profile=use_temp_profile,
-                max_retries=3,
-                debug_mode=True
-            )
+            # login_bulenox_with_profile returns None when a login attempt fails, so
+            # failed attempts (and WebDriver start-up errors) are retried with backoff
+            self.driver = _retry_with_backoff(lambda: login_bulenox_with_profile(debug=True), attempts=3)
             
             # Update profile history based on login result
-            if self.driver:
+            success = bool(self.driver)
+            if success:
                 self.logger.info(f"Login successful with profile {preferred_profile}")
-                # Reset failure count for successful profile
-                if preferred_profile in profile_failures:
-                    profile_failures[preferred_profile]['failures'] = 0
-                    profile_failures[preferred_profile]['last_success'] = datetime.datetime.now().isoformat()
-                else:
-                    profile_failures[preferred_profile] = {
-                        'failures': 0,
-                        'last_success': datetime.datetime.now().isoformat()
-                    }
+                # Lookups use explicit waits; make sure element misses never add an implicit wait
+                self.driver.implicitly_wait(0)
+                self.prepare_driver()
                 # Take a screenshot of successful login
                 self.take_screenshot("login_success")
-                success = True
             else:
                 self.logger.error(f"Login failed with profile {preferred_profile}")
-                # Increment failure count
-                if preferred_profile in profile_failures:
-                    profile_failures[preferred_profile]['failures'] = profile_failures[preferred_profile].get('failures', 0) + 1
-                else:
-                    profile_failures[preferred_profile] = {
-                        'failures': 1,
-                        'last_failure': datetime.datetime.now().isoformat()
-                    }
-                success = False
             
             # Save updated profile history
             try:
-                with open(profile_history_file, 'w') as f:
-                    json.dump(profile_failures, f, indent=2)
+                self._update_profile_history(profile_history_file, preferred_profile, success)
             except Exception as e:
                 self.logger.error(f"Failed to save profile history: {e}")
             
@@ -199,18 +556,171 @@ class CloudTradeExecutor:
             self.logger.error(f"Login failed with exception: {e}")
             return False
     
-    def take_screenshot(self, name_prefix):
-        """Take a screenshot and save it to the screenshots directory"""
+    @classmethod
+    def _checkout_driver(cls, account_id):
+        """Take the pooled driver for an account if it is recent and still responsive, else None"""
+        with cls._pool_lock:
+            entry = cls._pool.pop(account_id, None)
+        if entry is None:
+            return None
+        driver, last_used = entry
+        if time.time() - last_used < POOL_IDLE_SECONDS:
+            try:
+                if driver.execute_script("return document.readyState") == "complete":
+                    return driver
+            except WebDriverException:
+                pass
+        _quit_driver(driver)
+        return None
+    
+    @classmethod
+    def _checkin_driver(cls, account_id, driver):
+        """Park a logged-in driver for reuse, keeping at most one per account"""
+        with cls._pool_lock:
+            previous = cls._pool.get(account_id)
+            cls._pool[account_id] = (driver, time.time())
+        if previous and previous[0] is not driver:
+            _quit_driver(previous[0])
+    
+    @classmethod
+    def close_idle(cls, max_idle=POOL_IDLE_SECONDS):
+        """Quit pooled drivers unused for more than max_idle seconds"""
+        cutoff = time.time() - max_idle
+        with cls._pool_lock:
+            idle = [account_id for account_id, (_, last_used) in cls._pool.items() if last_used < cutoff]
+            drivers = [cls._pool.pop(account_id)[0] for account_id in idle]
+        for driver in drivers:
+            _quit_driver(driver)
+    
+    @classmethod
+    def close_all(cls):
+        """Quit every pooled driver"""
+        cls.close_idle(max_idle=-1)
+    
+    @classmethod
+    def _load_profile_history(cls, profile_history_file):
+        """Return the parsed profile history, re-reading the file only when its mtime changes"""
+        mtime = os.stat(profile_history_file).st_mtime_ns
+        if cls._profile_history_cache is None or mtime != cls._profile_history_mtime:
+            cls._profile_history_cache = read_json(profile_history_file)
+            cls._profile_history_mtime = mtime
+        return cls._profile_history_cache
+    
+    def _update_profile_history(self, profile_history_file, profile, success):
+        """Record a login result for a profile, re-reading the history under a file lock"""
+        # Local time to the second, as isoformat(timespec='seconds') would give
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with locked_file(profile_history_file):
+            try:
+                profile_failures = read_json(profile_history_file)
+            except (FileNotFoundError, ValueError):
+                profile_failures = {}
+            
+            if success:
+                # Reset failure count for successful profile
+                if profile in profile_failures:
+                    profile_failures[profile]['failures'] = 0
+                    profile_failures[profile]['last_success'] = now
+                else:
+                    profile_failures[profile] = {
+                        'failures': 0,
+                        'last_success': now
+                    }
+            else:
+                # Increment failure count
+                if profile in profile_failures:
+                    profile_failures[profile]['failures'] = profile_failures[profile].get('failures', 0) + 1
+                else:
+                    profile_failures[profile] = {
+                        'failures': 1,
+                        'last_failure': now
+                    }
+            
+            write_json_atomic(profile_history_file, profile_failures)
+            
+            # Keep the read cache in step with what was just written
+            CloudTradeExecutor._profile_history_cache = profile_failures
+            CloudTradeExecutor._profile_history_mtime = os.stat(profile_history_file).st_mtime_ns
+    
+    def prepare_driver(self):
+        """Block resources the trade page doesn't need so navigation moves fewer bytes"""
+        if not self.block_resources:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URLS)})
+            self.logger.info("Blocking images, fonts and analytics requests")
+        except (AttributeError, WebDriverException) as e:
+            # execute_cdp_cmd only exists on Chromium drivers
+            self.logger.warning(f"Could not block page resources: {e}")
+    
+    def _type_value(self, element, value):
+        """Replace an input's value in one WebDriver call, or type it per character when HUMAN_TYPING is set"""
+        if not self.human_typing:
+            # Native setter plus input/change events, so React-controlled inputs register it
+            self.driver.execute_script(_JS_SET_VALUE, element, value)
+            return
+        element.clear()
+        for char in value:
+            element.send_keys(char)
+            time.sleep(random.uniform(0.05, 0.15))  # Human-like typing delay
+    
+    def _wait_for_any(self, selectors, timeout):
+        """Wait once for the first clickable element matching any of the XPath selectors, or return None"""
+        try:
+            return WebDriverWait(self.driver, timeout).until(
+                EC.any_of(*(EC.element_to_be_clickable((By.XPATH, selector)) for selector in selectors))
+            )
+        except TimeoutException:
+            return None
+    
+    def _find_button(self, button_text):
+        """Find the BUY/SELL button, searching only down to the _BUTTON_XPATHS tier that matched last time when possible"""
+        selectors = [template.format(bt=button_text) for template in _BUTTON_XPATHS]
+        count_xpath = _BUTTON_COUNT_XPATH.format(bt=button_text)
+        
+        # The more specific tiers are always checked first, so a cached fallback
+        # tier never wins over an Order module match that has since appeared
+        tier = self._button_tiers.get(button_text)
+        found = None
+        if tier is not None:
+            found = self.driver.execute_script(_FIND_BUTTON_JS, count_xpath, selectors[:tier + 1])
+            if not found["button"]:
+                self.logger.info(f"{button_text} button no longer matches its cached tier, searching again")
+                del self._button_tiers[button_text]
+                found = None
+        
+        # Count the BUY or SELL buttons and try the button locations from most
+        # to least specific (Order module, sibling context, first match,
+        # class/container, then generic) in one browser-side pass
+        if found is None:
+            found = self.driver.execute_script(_FIND_BUTTON_JS, count_xpath, selectors)
+        self.logger.info(f"Found {found['count']} {button_text} buttons on the page")
+        
+        button = found["button"]
+        if button:
+            self._button_tiers[button_text] = found['index']
+            self.logger.info(f"Found {button_text} button with selector: {selectors[found['index']]}")
+        return button
+    
+    def take_screenshot(self, name_prefix, failure=False):
+        """Take a screenshot and save it to the screenshots directory; success-path shots are written in the background"""
+        if not (self.screenshot_on_failure if failure else self.screenshot_on_success):
+            return
         if not self.driver:
             self.logger.warning("Cannot take screenshot: No driver available")
             return
         
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
             filename = f"{name_prefix}_{self.account_id}_{timestamp}.png"
             filepath = os.path.join(self.screenshot_dir, filename)
-            self.driver.save_screenshot(filepath)
-            self.logger.info(f"Screenshot saved to: {filepath}")
+            if failure:
+                self.driver.save_screenshot(filepath)
+                self.logger.info(f"Screenshot saved to: {filepath}")
+            else:
+                # Capture now so the image shows this moment; only the disk write is deferred
+                _SCREENSHOT_POOL.submit(_write_screenshot, filepath, self.driver.get_screenshot_as_png())
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
     
@@ -253,110 +763,47 @@ class CloudTradeExecutor:
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
                 
-                # Wait for unique markers like Order module using JavaScript
-                try:
-                    WebDriverWait(self.driver, 15).until(
-                        lambda d: d.execute_script("return document.querySelector('.order-module') !== null")
-                    )
-                    self.logger.info("Order module detected in DOM via JavaScript")
-                except Exception as e:
-                    self.logger.warning(f"Order module not detected with JS: {e}, trying alternative selectors")
-                    # Try alternative selectors if the order module isn't found
-                    try:
-                        WebDriverWait(self.driver, 15).until(
-                            lambda d: d.execute_script(
-                                "return (document.querySelector('.trade-form') !== null || "
-                                "document.querySelector('.trading-panel') !== null || "
-                                "document.querySelector('button:contains(\'BUY\')') !== null)"
-                            )
-                        )
-                        self.logger.info("Alternative trading UI elements detected via JavaScript")
-                    except Exception as alt_e:
-                        self.logger.warning(f"Failed to detect trading UI elements via JavaScript: {alt_e}")
-                        # Try traditional XPath as fallback
-                        try:
-                            WebDriverWait(self.driver, 15).until(
-                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'order-module') or contains(@class, 'trade-form') or contains(@class, 'trading-panel')]"))
-                            )
-                            self.logger.info("Trading UI elements detected via XPath")
-                        except Exception as xpath_e:
-                            self.logger.error(f"Failed to detect trading UI elements via XPath: {xpath_e}")
-                            # Continue anyway, but log the issue
-                
-                # Check for "Time and Sales" tab as another indicator of UI readiness
+                # Wait for the Order module or any other trading panel marker; a
+                # MutationObserver resolves as soon as it appears instead of polling
                 try:
-                    # First try JavaScript detection
-                    time_sales_present = self.driver.execute_script(
-                        "return document.querySelector('*:contains(\'Time and Sales\')') !== null"
-                    )
-                    if time_sales_present:
-                        self.logger.info("'Time and Sales' tab detected via JavaScript, UI appears fully loaded")
+                    if self.driver.execute_async_script(_WAIT_TRADING_UI_JS, 15000):
+                        self.logger.info("Trading UI elements detected via JavaScript")
                     else:
-                        # Try XPath as fallback
-                        try:
-                            time_sales_element = WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Time and Sales') or contains(@class, 'time-sales')]"))
-                            )
-                            self.logger.info("'Time and Sales' tab detected via XPath")
-                        except Exception as ts_xpath_e:
-                            self.logger.warning(f"'Time and Sales' tab not detected via XPath: {ts_xpath_e}")
+                        self.logger.error("Trading UI elements not detected within 15s")
                 except Exception as e:
-                    self.logger.warning(f"Could not check for 'Time and Sales' tab via JavaScript: {e}")
+                    self.logger.error(f"Failed to detect trading UI elements: {e}")
+                    # Continue anyway, but log the issue
                 
                 # Take screenshot to see what we're working with
                 self.take_screenshot("trade_page_loaded")
                 
-                # Check current URL
-                current_url = self.driver.current_url
-                self.logger.info(f"Current URL after navigation: {current_url}")
-                
-                # Get page title
-                page_title = self.driver.title
-                self.logger.info(f"Page title: {page_title}")
-                
-                # Use JavaScript to check for account balance (bonus feature)
+                # Read page state, balance and last signal in one round trip
                 try:
-                    # Try multiple approaches to find account balance
-                    js_balance_checks = [
-                        "return window.accountBalance || null",
-                        "return document.querySelector('.account-balance, .balance, .account-value')?.textContent || null",
-                        "return Array.from(document.querySelectorAll('*')).find(el => el.textContent.includes('Balance:'))?.textContent || null"
-                    ]
+                    probes = self.driver.execute_script(_PAGE_PROBE_JS)
                     
-                    for js_check in js_balance_checks:
-                        account_balance = self.driver.execute_script(js_check)
-                        if account_balance:
-                            self.logger.info(f"Account balance from JS: {account_balance}")
-                            break
+                    if probes["timeSales"]:
+                        self.logger.info("'Time and Sales' tab detected, UI appears fully loaded")
+                    else:
+                        self.logger.warning("'Time and Sales' tab not detected")
                     
-                    if not account_balance:
-                        self.logger.warning("Could not retrieve account balance via any JS method")
-                except Exception as e:
-                    self.logger.warning(f"Error retrieving account balance via JS: {e}")
-                
-                # Use JavaScript to check for last signal (bonus feature)
-                try:
-                    # Try multiple approaches to find last signal
-                    js_signal_checks = [
-                        "return window.lastSignal || null",
-                        "return document.querySelector('.last-signal, .signal, .trade-signal')?.textContent || null",
-                        "return Array.from(document.querySelectorAll('*')).find(el => el.textContent.includes('Signal:'))?.textContent || null"
-                    ]
+                    self.logger.info(f"Current URL after navigation: {probes['url']}")
+                    self.logger.info(f"Page title: {probes['title']}")
                     
-                    for js_check in js_signal_checks:
-                        last_signal = self.driver.execute_script(js_check)
-                        if last_signal:
-                            self.logger.info(f"Last signal from JS: {last_signal}")
-                            break
+                    if probes["balance"]:
+                        self.logger.info(f"Account balance from JS: {probes['balance']}")
+                    else:
+                        self.logger.warning("Could not retrieve account balance via any JS method")
                     
-                    if not last_signal:
+                    if probes["signal"]:
+                        self.logger.info(f"Last signal from JS: {probes['signal']}")
+                    else:
                         self.logger.warning("Could not retrieve last signal via any JS method")
                 except Exception as e:
-                    self.logger.warning(f"Error retrieving last signal via JS: {e}")
+                    self.logger.warning(f"Error probing trade page via JS: {e}")
                 
             except Exception as e:
                 self.logger.error(f"Failed to navigate to trade page: {e}")
-                self.take_screenshot("navigation_error")
+                self.take_screenshot("navigation_error", failure=True)
                 self.log_trade_status(signal, "failed", f"Navigation error: {str(e)}")
                 self._log_emotional_feedback(False)
                 return False
@@ -367,73 +814,41 @@ class CloudTradeExecutor:
                 self.logger.info(f"Looking for symbol input to enter {futures_symbol}")
                 
                 # Try multiple selectors for symbol input
-                symbol_input = None
-                symbol_selectors = [
-                    "//input[@type='text' and @placeholder='Symbol']",
-                    "//div[contains(@class, 'symbol-search')]//input",
-                    "//input[contains(@class, 'symbol')]"
-                ]
-                
-                for selector in symbol_selectors:
-                    try:
-                        symbol_input = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        self.logger.info(f"Found symbol input using selector: {selector}")
-                        break
-                    except Exception:
-                        continue
+                symbol_input = self._wait_for_any(_SYMBOL_SELECTORS, 10)
+                if symbol_input:
+                    self.logger.info("Found symbol input")
                 
                 if not symbol_input:
                     self.logger.error("Could not find symbol input field")
                     raise Exception("Symbol input field not found")
                 
-                # Clear and enter symbol with human-like typing
-                symbol_input.clear()
-                for char in futures_symbol:
-                    symbol_input.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.15))  # Human-like typing delay
+                # Replace any existing text with the symbol
+                self._type_value(symbol_input, futures_symbol)
                 
                 self.logger.info(f"Entered symbol: {futures_symbol}")
-                time.sleep(1)  # Wait for symbol to register
                 
-                # Try to select from dropdown if it appears
+                # Try to select from dropdown if it appears; most symbols show none, so
+                # poll briefly and fall through to Enter instead of waiting out a long timeout
                 try:
-                    dropdown_item = WebDriverWait(self.driver, 5).until(
+                    dropdown_item = WebDriverWait(self.driver, DROPDOWN_WAIT_SECONDS, poll_frequency=0.05).until(
                         EC.element_to_be_clickable((By.XPATH, f"//div[contains(text(), '{futures_symbol}')]")),
                     )
                     dropdown_item.click()
                     self.logger.info("Selected symbol from dropdown")
-                except Exception as e:
+                except WebDriverException as e:
                     self.logger.warning(f"No dropdown selection needed or available: {e}")
                     # Press Enter as fallback
                     symbol_input.send_keys(Keys.ENTER)
                 
                 # Set quantity
                 self.logger.info(f"Setting quantity to {quantity}")
-                quantity_selectors = [
-                    "//input[@type='number']",
-                    "//input[contains(@placeholder, 'Qty') or contains(@placeholder, 'Quantity')]",
-                    "//label[contains(text(), 'Quantity') or contains(text(), 'Qty')]/following::input"
-                ]
-                
-                quantity_input = None
-                for selector in quantity_selectors:
-                    try:
-                        quantity_input = WebDriverWait(self.driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        self.logger.info(f"Found quantity input using selector: {selector}")
-                        break
-                    except Exception:
-                        continue
+                quantity_input = self._wait_for_any(_QTY_SELECTORS, 10)
+                if quantity_input:
+                    self.logger.info("Found quantity input")
                 
                 if quantity_input:
-                    # Clear existing value and set new quantity
-                    quantity_input.clear()
-                    for char in str(quantity):
-                        quantity_input.send_keys(char)
-                        time.sleep(random.uniform(0.05, 0.15))  # Human-like typing delay
+                    # Replace existing value with the new quantity
+                    self._type_value(quantity_input, str(quantity))
                     self.logger.info(f"Set quantity to {quantity}")
                 else:
                     self.logger.warning("Could not find quantity input, using default")
@@ -441,28 +856,12 @@ class CloudTradeExecutor:
                 # Set stop loss if provided
                 if stop_loss:
                     self.logger.info(f"Setting stop loss to {stop_loss}")
-                    stop_loss_selectors = [
-                        "//input[contains(@placeholder, 'Stop') or contains(@placeholder, 'SL')]",
-                        "//label[contains(text(), 'Stop Loss')]/following::input",
-                        "//div[contains(text(), 'Stop Loss')]/following::input"
-                    ]
-                    
-                    stop_loss_input = None
-                    for selector in stop_loss_selectors:
-                        try:
-                            stop_loss_input = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((By.XPATH, selector))
-                            )
-                            self.logger.info(f"Found stop loss input using selector: {selector}")
-                            break
-                        except Exception:
-                            continue
+                    stop_loss_input = self._wait_for_any(_SL_SELECTORS, 5)
+                    if stop_loss_input:
+                        self.logger.info("Found stop loss input")
                     
                     if stop_loss_input:
-                        stop_loss_input.clear()
-                        for char in str(stop_loss):
-                            stop_loss_input.send_keys(char)
-                            time.sleep(random.uniform(0.05, 0.15))  # Human-like typing delay
+                        self._type_value(stop_loss_input, str(stop_loss))
                         self.logger.info(f"Set stop loss to {stop_loss}")
                     else:
                         self.logger.warning("Could not find stop loss input")
@@ -470,28 +869,12 @@ class CloudTradeExecutor:
                 # Set take profit if provided
                 if take_profit:
                     self.logger.info(f"Setting take profit to {take_profit}")
-                    take_profit_selectors = [
-                        "//input[contains(@placeholder, 'Take Profit') or contains(@placeholder, 'TP')]",
-                        "//label[contains(text(), 'Take Profit')]/following::input",
-                        "//div[contains(text(), 'Take Profit')]/following::input"
-                    ]
-                    
-                    take_profit_input = None
-                    for selector in take_profit_selectors:
-                        try:
-                            take_profit_input = WebDriverWait(self.driver, 5).until(
-                                EC.element_to_be_clickable((By.XPATH, selector))
-                            )
-                            self.logger.info(f"Found take profit input using selector: {selector}")
-                            break
-                        except Exception:
-                            continue
+                    take_profit_input = self._wait_for_any(_TP_SELECTORS, 5)
+                    if take_profit_input:
+                        self.logger.info("Found take profit input")
                     
                     if take_profit_input:
-                        take_profit_input.clear()
-                        for char in str(take_profit):
-                            take_profit_input.send_keys(char)
-                            time.sleep(random.uniform(0.05, 0.15))  # Human-like typing delay
+                        self._type_value(take_profit_input, str(take_profit))
                         self.logger.info(f"Set take profit to {take_profit}")
                     else:
                         self.logger.warning("Could not find take profit input")
@@ -503,96 +886,33 @@ class CloudTradeExecutor:
                 # Take a screenshot before clicking
                 self.take_screenshot(f"before_{button_text.lower()}_click")
                 
-                # Count how many BUY or SELL buttons exist on the page
-                all_buttons = self.driver.find_elements(By.XPATH, f"//button[contains(text(), '{button_text}')]")
-                button_count = len(all_buttons)
-                self.logger.info(f"Found {button_count} {button_text} buttons on the page")
-                
-                # Try to find the button
-                button = None
-                
-                # First try to find button specifically within the left-side "Order" module
-                try:
-                    button = self.driver.find_element(By.XPATH, f"(//div[contains(@class, 'order-module') or contains(@class, 'trade-form')]//button[contains(text(), '{button_text}')])[1]")
-                    self.logger.info(f"Found {button_text} button in Order module")
-                except Exception:
-                    self.logger.warning(f"Could not find {button_text} button in Order module")
-                
-                # If not found, try with sibling context using unique structures
+                button = self._find_button(button_text)
                 if not button:
-                    try:
-                        # Look for button near Order Type, Market, or input boxes
-                        sibling_selectors = [
-                            f"//label[text()='Order Type']/../..//button[contains(text(), '{button_text}')]",
-                            f"//label[text()='Market']/../..//button[contains(text(), '{button_text}')]",
-                            f"//input[@type='number']/../..//button[contains(text(), '{button_text}')]"
-                        ]
-                        
-                        for selector in sibling_selectors:
-                            try:
-                                button = self.driver.find_element(By.XPATH, selector)
-                                self.logger.info(f"Found {button_text} button with sibling context: {selector}")
-                                break
-                            except Exception:
-                                continue
-                    except Exception as e:
-                        self.logger.warning(f"Error finding {button_text} button with sibling context: {e}")
+                    self.logger.error(f"Could not find {button_text} button with any approach")
+                    raise Exception(f"{button_text} button not found")
                 
-                # If still not found, try by button index inside parent container
-                if not button and button_count > 0:
-                    try:
-                        # Try to find the first button in the trading panel
-                        button = self.driver.find_element(By.XPATH, f"(//button[contains(text(), '{button_text}')])[1]")
-                        self.logger.info(f"Found {button_text} button by index")
-                    except Exception:
-                        self.logger.warning(f"Could not find {button_text} button by index")
-                
-                # If still not found, try by distinct button class or container proximity
-                if not button:
-                    try:
-                        class_selectors = [
-                            f"//button[contains(@class, 'buy-button') or contains(@class, 'sell-button')][contains(text(), '{button_text}')]",
-                            f"//button[contains(@class, 'primary')][contains(text(), '{button_text}')]",
-                            f"//div[contains(@class, 'trading-panel')]//button[contains(text(), '{button_text}')]"
-                        ]
-                        
-                        for selector in class_selectors:
-                            try:
-                                button = self.driver.find_element(By.XPATH, selector)
-                                self.logger.info(f"Found {button_text} button with class selector: {selector}")
-                                break
-                            except Exception:
-                                continue
-                    except Exception as e:
-                        self.logger.warning(f"Error finding {button_text} button with class selectors: {e}")
-                
-                # If still not found, try a more generic approach
-                if not button:
-                    try:
-                        button = self.driver.find_element(By.XPATH, f"//button[contains(., '{button_text}')]")
-                        self.logger.info(f"Found {button_text} button with generic approach")
-                    except Exception as e:
-                        self.logger.error(f"Could not find {button_text} button with any approach: {e}")
-                        raise Exception(f"{button_text} button not found")
-                
-                # Scroll the button into view using JavaScript
-                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'})", button)
-                self.logger.info(f"Scrolled {button_text} button into view")
-                time.sleep(0.5)  # Short wait after scrolling
+                # Wait only as long as it takes the button to become clickable
+                wait = WebDriverWait(self.driver, 5, poll_frequency=0.1)
+                try:
+                    wait.until(EC.element_to_be_clickable(button))
+                except TimeoutException:
+                    self.logger.warning(f"{button_text} button not reported clickable, clicking anyway")
                 
-                # Try standard click first
+                # Scroll and click in one script call
                 try:
-                    button.click()
-                    self.logger.info(f"Clicked {button_text} button with standard click")
-                except Exception as click_error:
-                    self.logger.warning(f"Standard click failed: {click_error}. Trying JavaScript click...")
-                    # Fallback to JavaScript click if standard click fails
+                    self.driver.execute_script(_JS_SCROLL_CLICK, button)
+                    self.logger.info(f"Scrolled to and clicked {button_text} button with JavaScript click")
+                except WebDriverException as js_error:
+                    self.logger.warning(f"JavaScript click failed: {js_error}. Trying standard click...")
+                    # Fallback to a native click if the script fails
                     try:
-                        self.driver.execute_script("arguments[0].click();", button)
-                        self.logger.info(f"Clicked {button_text} button with JavaScript click")
-                    except Exception as js_error:
-                        self.logger.error(f"JavaScript click also failed: {js_error}")
-                        raise Exception(f"Failed to click {button_text} button: {js_error}")
+                        button.click()
+                        self.logger.info(f"Clicked {button_text} button with standard click")
+                    except WebDriverException as click_error:
+                        self.logger.error(f"Standard click also failed: {click_error}")
+                        # The cached tier may have found the wrong element; search every tier next trade
+                        self._button_tiers.pop(button_text, None)
+                        raise Exception(f"Failed to click {button_text} button: {click_error}")
                 
                 # Take a screenshot after clicking
                 self.take_screenshot(f"after_{button_text.lower()}_click")
@@ -605,17 +925,23 @@ class CloudTradeExecutor:
                     # Find and click the confirm button
                     confirm_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Confirm') or contains(text(), 'OK') or contains(text(), 'Yes')]")
                     try:
+                        self.driver.execute_script(_JS_SCROLL_CLICK, confirm_button)
+                        self.logger.info("Clicked confirm button with JavaScript click")
+                    except WebDriverException as confirm_click_error:
+                        self.logger.warning(f"JavaScript confirm click failed: {confirm_click_error}. Trying standard click...")
                         confirm_button.click()
                         self.logger.info("Clicked confirm button with standard click")
-                    except Exception as confirm_click_error:
-                        self.logger.warning(f"Standard confirm click failed: {confirm_click_error}. Trying JavaScript click...")
-                        self.driver.execute_script("arguments[0].click();", confirm_button)
-                        self.logger.info("Clicked confirm button with JavaScript click")
-                except Exception as e:
+                except WebDriverException as e:
                     self.logger.info(f"No confirmation dialog appeared or error handling it: {e}")
                 
                 # Wait for success message or trade to appear in history
-                time.sleep(2)  # Short wait for UI to update
+                try:
+                    WebDriverWait(self.driver, TRADE_CONFIRM_WAIT_SECONDS, poll_frequency=0.1).until(
+                        EC.any_of(*(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in _TRADE_CONFIRM_SELECTORS))
+                    )
+                    self.logger.info("Trade confirmation detected")
+                except TimeoutException:
+                    self.logger.info("No trade confirmation detected, continuing")
                 
                 # Log successful trade
                 self.logger.info(f"Successfully executed {side} trade for {quantity} {futures_symbol}")
@@ -628,16 +954,16 @@ class CloudTradeExecutor:
                 
             except Exception as e:
                 self.logger.error(f"Error during trade execution: {e}")
-                self.take_screenshot("trade_execution_error")
+                self.take_screenshot("trade_execution_error", failure=True)
                 self.log_trade_status(signal, "failed", f"Trade execution error: {str(e)}")
                 self._log_emotional_feedback(False)
                 return False
             
         except Exception as e:
             self.logger.error(f"Error during trade execution: {e}")
-            self.take_screenshot("trade_error")
+            self.take_screenshot("trade_error", failure=True)
             
-            # Log trade to status.json
+            # Log trade to status.jsonl
             self.log_trade_status(signal, "failed", str(e))
             
             # Add emotional feedback for failure
@@ -654,40 +980,17 @@ class CloudTradeExecutor:
         
         self.logger.info(message)
         
-        # Also save to a dedicated emotional feedback file for potential UI display
-        try:
-            feedback_file = os.path.join(log_dir, "emotional_feedback.json")
-            
-            # Load existing feedback if available
-            try:
-                with open(feedback_file, 'r') as f:
-                    feedback_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                feedback_data = []
-            
-            # Add new feedback
-            feedback_data.append({
-                "timestamp": datetime.datetime.now().isoformat(),
-                "success": success,
-                "message": message,
-                "session_id": self.session_id
-            })
-            
-            # Keep only the last 100 entries
-            if len(feedback_data) > 100:
-                feedback_data = feedback_data[-100:]
-            
-            # Save updated feedback
-            with open(feedback_file, 'w') as f:
-                json.dump(feedback_data, f, indent=2)
-                
-        except Exception as e:
-            self.logger.error(f"Failed to save emotional feedback: {e}")
+        # Keep it in memory for the UI and hand it to the background writer
+        entry = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "success": success,
+            "message": message,
+            "session_id": self.session_id
+        }
+        _record_feedback(entry)
     
     def log_trade_status(self, signal, status, error_message=None):
-        """Log trade status to status.json"""
-        status_file = os.path.join(log_dir, "status.json")
-        
+        """Append the trade status as one line of status.jsonl"""
         # Create status entry
         status_entry = {
             "timestamp": datetime.datetime.now().isoformat(),
@@ -700,34 +1003,28 @@ class CloudTradeExecutor:
         if error_message:
             status_entry["error"] = error_message
         
-        # Load existing status file if it exists
+        # Append one line; the cost no longer grows with the trade history
         try:
-            if os.path.exists(status_file):
-                with open(status_file, 'r') as f:
-                    status_data = json.load(f)
-            else:
-                status_data = {"trades": []}
+            with open(STATUS_LOG_FILE, 'ab') as f:
+                f.write(dumps_json_line(status_entry))
             
-            # Add new entry
-            status_data["trades"].append(status_entry)
-            
-            # Update last_update timestamp
-            status_data["last_update"] = datetime.datetime.now().isoformat()
-            
-            # Write back to file
-            with open(status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
-            
-            self.logger.info(f"Trade status logged to {status_file}")
+            self.logger.info(f"Trade status logged to {STATUS_LOG_FILE}")
         except Exception as e:
             self.logger.error(f"Failed to log trade status: {e}")
     
-    def close(self):
-        """Close the browser"""
+    def close(self, recycle=True):
+        """Release the browser: park it in the driver pool for reuse, or quit it when recycle is False"""
         if self.driver:
-            self.driver.quit()
+            if recycle:
+                self._checkin_driver(self.account_id, self.driver)
+                self.logger.info("Browser returned to pool")
+            else:
+                self.driver.quit()
+                self.logger.info("Browser closed")
             self.driver = None
-            self.logger.info("Browser closed")
+
+# Quit any pooled browsers when the process exits
+atexit.register(CloudTradeExecutor.close_all)
 
 # Example usage
 def main():
@@ -78,6 +78,8 @@ def login_bulenox_with_profile(debug=False):
     chrome_options.add_experimental_option("detach", True)
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Return from driver.get at DOMContentLoaded; every later step uses explicit waits
+    chrome_options.page_load_strategy = "eager"
     
     # Create Chrome driver without specifying service path (uses WebDriver Manager)
     logger.info("Initializing Chrome with user profile...")
@@ -108,6 +110,7 @@ def login_bulenox_with_profile(debug=False):
             try:
                 minimal_options = Options()
                 minimal_options.add_argument("--start-maximized")
+                minimal_options.page_load_strategy = "eager"
                 driver = webdriver.Chrome(options=minimal_options)
             except Exception as e3:
                 logger.error(f"All Chrome initialization attempts failed: {e3}")
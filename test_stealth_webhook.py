@@ -58,7 +58,7 @@ def test_stealth_webhook():
                 print("  ✓ Bot logged into Bulenox using stealth automation")
                 print("  ✓ Executed the trade or simulated it in demo mode")
                 print("  ✓ Sent prophetic alert to Slack (if configured)")
-                print("  ✓ Logged trade session to status.json")
+                print("  ✓ Logged trade session to status.jsonl")
                 print("  ✓ Saved screenshots to /logs/screens/ folder")
                 
                 # Check for screenshots
@@ -85,31 +85,31 @@ def test_stealth_webhook():
                 if os.path.exists(logs_dir):
                     print("\n📋 Checking logs for additional information...")
                     
-                    # Check stealth_trades.json
-                    stealth_log_path = os.path.join(logs_dir, "stealth_trades.json")
+                    # Check stealth_trades.jsonl (one JSON record per line)
+                    stealth_log_path = os.path.join(logs_dir, "stealth_trades.jsonl")
                     if os.path.exists(stealth_log_path):
                         try:
                             with open(stealth_log_path, 'r') as f:
-                                stealth_logs = json.load(f)
-                                if stealth_logs and isinstance(stealth_logs, list) and len(stealth_logs) > 0:
-                                    latest_log = stealth_logs[-1]
+                                stealth_logs = [line for line in f if line.strip()]
+                                if stealth_logs:
+                                    latest_log = json.loads(stealth_logs[-1])
                                     print(f"\n📝 Latest stealth trade log:")
                                     print(json.dumps(latest_log, indent=2))
                         except Exception as e:
-                            print(f"Could not read stealth_trades.json: {e}")
+                            print(f"Could not read stealth_trades.jsonl: {e}")
                     
-                    # Check status.json
-                    status_log_path = os.path.join(logs_dir, "status.json")
+                    # Check status.jsonl (one JSON record per line)
+                    status_log_path = os.path.join(logs_dir, "status.jsonl")
                     if os.path.exists(status_log_path):
                         try:
                             with open(status_log_path, 'r') as f:
-                                status_data = json.load(f)
-                                if 'trades' in status_data and len(status_data['trades']) > 0:
-                                    latest_status = status_data['trades'][-1]
+                                status_lines = [line for line in f if line.strip()]
+                                if status_lines:
+                                    latest_status = json.loads(status_lines[-1])
                                     print(f"\n📊 Latest status log:")
                                     print(json.dumps(latest_status, indent=2))
                         except Exception as e:
-                            print(f"Could not read status.json: {e}")
+                            print(f"Could not read status.jsonl: {e}")
         except Exception as e:
             print(f"\n⚠️ Could not parse JSON response: {e}")
             print(f"📄 Raw Response: {response.text}")